@@ -0,0 +1,29 @@
+"""Add index for recently sent notification lookups
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+# revision identifiers
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build concurrently so notifications stays writable during the migration
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notif_sent_recent "
+                "ON notifications (request_id, notification_type, sent_at) WHERE sent = true"
+            )
+    else:
+        op.create_index('ix_notif_sent_recent', 'notifications', ['request_id', 'notification_type', 'sent_at'])
+
+
+def downgrade():
+    op.drop_index('ix_notif_sent_recent', table_name='notifications')
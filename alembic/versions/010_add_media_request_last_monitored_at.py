@@ -0,0 +1,23 @@
+"""Add last_monitored_at to media_requests table
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # NULL means never checked, so every existing request is picked up on the next sweep
+    op.add_column('media_requests', sa.Column('last_monitored_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('media_requests', 'last_monitored_at')
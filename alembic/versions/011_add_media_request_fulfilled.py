@@ -0,0 +1,36 @@
+"""Add media_available and fulfilled_at to media_requests table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing requests start as not available; the next monitor run marks the finished ones
+    op.add_column('media_requests', sa.Column('media_available', sa.Boolean(), nullable=False, server_default='false'))
+    op.add_column('media_requests', sa.Column('fulfilled_at', sa.DateTime(), nullable=True))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build concurrently so media_requests stays writable during the migration
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_media_requests_monitor "
+                "ON media_requests (status, media_available, last_monitored_at)"
+            )
+    else:
+        op.create_index('ix_media_requests_monitor', 'media_requests', ['status', 'media_available', 'last_monitored_at'])
+
+
+def downgrade():
+    op.drop_index('ix_media_requests_monitor', table_name='media_requests')
+    op.drop_column('media_requests', 'fulfilled_at')
+    op.drop_column('media_requests', 'media_available')
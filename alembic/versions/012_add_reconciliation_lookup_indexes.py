@@ -0,0 +1,34 @@
+"""Add indexes for reconciliation episode and notification lookups
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+# revision identifiers
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_ep_tracking_sid_s_e', 'episode_tracking', ['series_id', 'season_number', 'episode_number']),
+    ('ix_notif_user_req_type', 'notifications', ['user_id', 'request_id', 'notification_type']),
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build concurrently so the tables stay writable during the migration
+        with op.get_context().autocommit_block():
+            for name, table, columns in INDEXES:
+                op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+    else:
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, columns in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
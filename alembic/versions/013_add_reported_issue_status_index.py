@@ -0,0 +1,26 @@
+"""Add index for the stale reported-issue scan
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+# revision identifiers
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Build concurrently so the table stays writable during the migration
+        with op.get_context().autocommit_block():
+            op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_issue_status_updated ON reported_issues (status, updated_at)")
+    else:
+        op.create_index('ix_issue_status_updated', 'reported_issues', ['status', 'updated_at'])
+
+
+def downgrade():
+    op.drop_index('ix_issue_status_updated', table_name='reported_issues')
@@ -7,54 +7,159 @@ Checks pending requests for:
 
 import asyncio
 import logging
+import time
+from collections import defaultdict
+from functools import lru_cache, partial
 from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, or_
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Optional
 
 from app.database import get_db, MediaRequest, Notification, User, EpisodeTracking
 from app.services.email_service import EmailService
-from app.services.sonarr_service import SonarrService
 from app.services.radarr_service import RadarrService
 from app.services.tmdb_service import TMDBService
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Poster URLs rarely change, so keep them across monitor runs
+# (media_type, tmdb_id) -> (poster_url, fetched_at monotonic seconds)
+POSTER_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_poster_cache = {}
+
+# Request IDs queued for an immediate re-check (fed by Sonarr/Radarr webhooks)
+_recheck_queue = asyncio.Queue()
+
+
+def request_quality_recheck(request_id: int):
+    """Queue a request to be re-checked on the worker's next wake-up instead of the next full sweep"""
+    _recheck_queue.put_nowait(request_id)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an *arr ISO 8601 timestamp ('Z' suffix allowed), cached since episode dates repeat every run"""
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
+
+def needs_quality_wait(episode: dict, aired_cutoff: datetime) -> bool:
+    """True if the episode aired before aired_cutoff but has no file, or one below the quality cutoff"""
+    if episode.get('hasFile') and not episode.get('episodeFile', {}).get('qualityCutoffNotMet', False):
+        return False  # Episode has file and meets quality requirements
+    air_date = episode.get('airDateUtc')
+    return bool(air_date) and _parse_iso(air_date) < aired_cutoff
+
+
+@lru_cache(maxsize=1)
+def _get_services():
+    """Create the monitor's services once per process so they (and their connections) are reused across runs"""
+    from app.services.sonarr_service import get_all_sonarr_instances
+    
+    sonarr_instances = get_all_sonarr_instances()  # Primary + anime if configured
+    return (
+        EmailService(),
+        sonarr_instances[0],
+        RadarrService(),
+        TMDBService(settings.jellyseerr_url, settings.jellyseerr_api_key),
+        sonarr_instances
+    )
+
 
 class QualityReleaseMonitor:
     def __init__(self):
-        self.email_service = EmailService()
-        self.sonarr = SonarrService()  # Primary instance for backward compat
-        self.radarr = RadarrService()
-        self.tmdb = TMDBService(settings.jellyseerr_url, settings.jellyseerr_api_key)
-        
-        # All Sonarr instances (primary + anime if configured)
-        from app.services.sonarr_service import get_all_sonarr_instances
-        self.sonarr_instances = get_all_sonarr_instances()
+        (
+            self.email_service,
+            self.sonarr,  # Primary instance for backward compat
+            self.radarr,
+            self.tmdb,
+            self.sonarr_instances  # All Sonarr instances (primary + anime if configured)
+        ) = _get_services()
+        
+        # Per-run snapshots of *arr state (refreshed by _load_arr_state)
+        self.sonarr_series_by_id = {}  # instance_name -> {series_id: series}
+        self.sonarr_series_by_tvdb = {}  # instance_name -> {tvdb_id: series}
+        self.sonarr_queue_series_ids = {}  # instance_name -> {series_id}
+        self.sonarr_profiles = {}  # instance_name -> {profile_id: name}
+        self.sonarr_episodes = {}  # instance_name -> {series_id: [episodes]}
+        self.radarr_movies_by_id = {}  # movie_id -> movie
+        self.radarr_movies_by_tmdb = {}  # tmdb_id -> movie
+        self.radarr_queue_movie_ids = set()
+        self.radarr_profiles = {}  # profile_id -> name
+        
+        # Per-run time cutoffs (set at the start of run)
+        self.now = datetime.now(timezone.utc)
+        self.aired_cutoff = self.now - timedelta(days=7)
+        self.coming_soon_cutoff = self.now - timedelta(days=30)
+        self.quality_cutoff = self.now - timedelta(days=7)
+        
+        # Notification rows queued during a run, inserted together at the end
+        self.new_notifications = []
     
-    async def run(self):
-        """Run the quality/release monitoring check"""
+    async def run(self, request_ids: Optional[set] = None):
+        """Run the quality/release monitoring check.
+        
+        Checks every pending request, or only those in request_ids when given.
+        """
         logger.info("Starting quality/release monitoring check...")
         
+        self.now = datetime.now(timezone.utc)
+        self.aired_cutoff = self.now - timedelta(days=7)  # Episodes aired more than a week ago
+        self.coming_soon_cutoff = self.now - timedelta(days=30)  # Coming soon sent at most every 30 days
+        self.quality_cutoff = self.now - timedelta(days=7)  # Quality waiting sent at most every 7 days
+        self.new_notifications = []
+        
         db = next(get_db())
         try:
             # Get all approved requests that aren't available yet
-            pending_requests = db.query(MediaRequest).filter(
+            query = db.query(MediaRequest).options(
+                selectinload(MediaRequest.user)
+            ).filter(
                 MediaRequest.status.in_(['pending', 'approved']),
-                MediaRequest.jellyseerr_request_id.isnot(None)
-            ).all()
+                MediaRequest.jellyseerr_request_id.isnot(None),
+                MediaRequest.media_available.is_(False)
+            )
+            if request_ids is not None:
+                # Webhook-triggered re-check: always check these, however recently they were checked
+                query = query.filter(MediaRequest.id.in_(request_ids))
+            else:
+                recheck_cutoff = datetime.utcnow() - timedelta(minutes=settings.quality_monitor_min_recheck_minutes)
+                query = query.filter(or_(
+                    MediaRequest.last_monitored_at.is_(None),
+                    MediaRequest.last_monitored_at < recheck_cutoff
+                ))
+            pending_requests = query.all()
             
             logger.info(f"Checking {len(pending_requests)} pending requests")
             
-            for request in pending_requests:
-                try:
-                    if request.media_type == 'tv':
-                        await self._check_tv_show(request, db)
-                    elif request.media_type == 'movie':
-                        await self._check_movie(request, db)
-                except Exception as e:
-                    logger.error(f"Failed to check request {request.id} ({request.title}): {e}")
+            notified = self._load_notified_map(pending_requests, db)
+            if pending_requests:
+                await self._load_arr_state(pending_requests)
+                await self._load_episodes(pending_requests)
+            
+            # Checks are I/O-bound on Sonarr/Radarr/TMDB, so run them concurrently.
+            # The session is shared: its calls are synchronous, so they never interleave mid-query.
+            semaphore = asyncio.Semaphore(max(1, settings.quality_monitor_concurrency))
+            
+            async def check(request: MediaRequest):
+                async with semaphore:
+                    try:
+                        if request.media_type == 'tv':
+                            await self._check_tv_show(request, notified)
+                        elif request.media_type == 'movie':
+                            await self._check_movie(request, notified)
+                        request.last_monitored_at = datetime.utcnow()
+                    except Exception as e:
+                        logger.error(f"Failed to check request {request.id} ({request.title}): {e}")
+            
+            await asyncio.gather(*(check(request) for request in pending_requests))
             
+            # One multi-row INSERT for every notification queued by the checks
+            if self.new_notifications:
+                db.execute(insert(Notification), self.new_notifications)
+                logger.info(f"Queued {len(self.new_notifications)} notification(s)")
             db.commit()
             logger.info("Quality/release monitoring check completed")
             
@@ -64,32 +169,132 @@ class QualityReleaseMonitor:
         finally:
             db.close()
     
-    async def _check_tv_show(self, request: MediaRequest, db: Session):
-        """Check TV show for release status and quality"""
-        # If we don't have a series_id, try to find it in Sonarr by TMDB ID
-        series = None
-        matched_sonarr = self.sonarr  # Default to primary
+    async def _load_arr_state(self, requests: List[MediaRequest]):
+        """Fetch libraries, download queues and quality profiles once per run instead of once per request"""
+        has_tv = any(r.media_type == 'tv' for r in requests)
+        has_movies = any(r.media_type == 'movie' for r in requests)
+        
+        self.sonarr_series_by_id = {}
+        self.sonarr_series_by_tvdb = {}
+        self.sonarr_queue_series_ids = {}
+        self.sonarr_profiles = {}
+        for sonarr_inst in (self.sonarr_instances if has_tv else []):
+            all_series = await sonarr_inst.get_all_series() or []
+            self.sonarr_series_by_id[sonarr_inst.instance_name] = {s.get('id'): s for s in all_series}
+            self.sonarr_series_by_tvdb[sonarr_inst.instance_name] = {
+                s.get('tvdbId'): s for s in all_series if s.get('tvdbId')
+            }
+            queue = await sonarr_inst.get_queue()
+            self.sonarr_queue_series_ids[sonarr_inst.instance_name] = {
+                item.get('seriesId') for item in queue if item.get('seriesId')
+            }
+            profiles = await sonarr_inst.get_quality_profiles()
+            self.sonarr_profiles[sonarr_inst.instance_name] = {
+                p.get('id'): p.get('name') for p in profiles or []
+            }
+        
+        self.radarr_movies_by_id = {}
+        self.radarr_movies_by_tmdb = {}
+        self.radarr_queue_movie_ids = set()
+        self.radarr_profiles = {}
+        if not has_movies:
+            return
+        
+        try:
+            movies = await self.radarr.get_movies() or []
+            self.radarr_movies_by_id = {m.get('id'): m for m in movies}
+            self.radarr_movies_by_tmdb = {m.get('tmdbId'): m for m in movies if m.get('tmdbId')}
+        except Exception as e:
+            logger.error(f"Failed to fetch movies from Radarr: {e}")
         
-        # Search across all Sonarr instances
+        try:
+            queue = await self.radarr._get("/queue")
+            if queue and 'records' in queue:
+                self.radarr_queue_movie_ids = {
+                    item.get('movieId') for item in queue['records'] if item.get('movieId')
+                }
+        except Exception as e:
+            logger.warning(f"Failed to fetch Radarr queue: {e}")
+        
+        try:
+            profiles = await self.radarr.get_quality_profiles()
+            self.radarr_profiles = {p.get('id'): p.get('name') for p in profiles or []}
+        except Exception as e:
+            logger.error(f"Failed to fetch Radarr quality profiles: {e}")
+    
+    def _find_series(self, request: MediaRequest):
+        """Find a request's series across all Sonarr instances. Returns (series, sonarr_instance)."""
         for sonarr_inst in self.sonarr_instances:
             if hasattr(request, 'series_id') and request.series_id:
-                try:
-                    s = await sonarr_inst.get_series(request.series_id)
-                    if s:
-                        series = s
-                        matched_sonarr = sonarr_inst
-                        break
-                except Exception:
-                    continue
+                series = self.sonarr_series_by_id.get(sonarr_inst.instance_name, {}).get(request.series_id)
             else:
                 # Look up series by TMDB ID
-                all_series = await sonarr_inst.get_all_series()
-                if all_series:
-                    s = next((s for s in all_series if s.get('tvdbId') == request.tmdb_id), None)
-                    if s:
-                        series = s
-                        matched_sonarr = sonarr_inst
-                        break
+                series = self.sonarr_series_by_tvdb.get(sonarr_inst.instance_name, {}).get(request.tmdb_id)
+            if series:
+                return series, sonarr_inst
+        return None, self.sonarr  # Default to primary
+    
+    async def _load_episodes(self, requests: List[MediaRequest]):
+        """Fetch episodes for every series that will need a quality check, batched per Sonarr instance"""
+        series_ids_by_instance = defaultdict(set)
+        instances = {}
+        for request in requests:
+            if request.media_type != 'tv':
+                continue
+            series, sonarr_inst = self._find_series(request)
+            if not series:
+                continue
+            if series.get('status') == 'upcoming' and series.get('firstAired'):
+                continue  # Handled by the coming soon check, episodes not needed
+            series_ids_by_instance[sonarr_inst.instance_name].add(series.get('id'))
+            instances[sonarr_inst.instance_name] = sonarr_inst
+        
+        self.sonarr_episodes = {}
+        for instance_name, series_ids in series_ids_by_instance.items():
+            self.sonarr_episodes[instance_name] = await instances[instance_name].get_episodes_for_series_ids(
+                list(series_ids),
+                concurrency=settings.quality_monitor_concurrency
+            )
+    
+    def _load_notified_map(self, requests: List[MediaRequest], db: Session) -> dict:
+        """Load when coming_soon/quality_waiting notifications were last sent for all requests in one query.
+        
+        A notification that is queued but not sent yet counts as sent now (failed sends are
+        retried by the email processor), so a re-check doesn't queue a second one.
+        
+        Returns {request_id: {notification_type: last_sent_at}}
+        """
+        notified = defaultdict(dict)
+        request_ids = [r.id for r in requests]
+        if not request_ids:
+            return notified
+        
+        rows = db.query(
+            Notification.request_id,
+            Notification.notification_type,
+            Notification.sent,
+            func.max(Notification.sent_at)
+        ).filter(
+            Notification.request_id.in_(request_ids),
+            Notification.notification_type.in_(["coming_soon", "quality_waiting"])
+        ).group_by(
+            Notification.request_id,
+            Notification.notification_type,
+            Notification.sent
+        ).all()
+        
+        for request_id, notification_type, sent, last_sent_at in rows:
+            if sent is False:
+                notified[request_id][notification_type] = self.now  # Pending - always blocks a new one
+            elif sent and last_sent_at is not None and notification_type not in notified[request_id]:
+                notified[request_id][notification_type] = last_sent_at
+        
+        return notified
+    
+    async def _check_tv_show(self, request: MediaRequest, notified: dict):
+        """Check TV show for release status and quality"""
+        # Search across all Sonarr instances (by series_id if we have one, else TMDB ID)
+        series, matched_sonarr = self._find_series(request)
         
         if not series:
             logger.debug(f"Series not yet in Sonarr for request {request.id} ({request.title})")
@@ -102,87 +307,60 @@ class QualityReleaseMonitor:
                 await self._send_coming_soon_notification(
                     request=request,
                     premiere_date=premiere_date,
-                    db=db
+                    notified=notified
                 )
                 return
         
         # Check if waiting for better quality
-        # Get all episodes for this series
-        episodes = await matched_sonarr.get_episodes_by_series(series.get('id'))
+        # Get all episodes for this series (prefetched by _load_episodes)
+        episodes = self.sonarr_episodes.get(matched_sonarr.instance_name, {}).get(series.get('id'))
         if not episodes:
             return
         
-        # Check if any episodes are available but in wrong quality
-        quality_profile = series.get('qualityProfileId')
-        for episode in episodes:
-            if episode.get('hasFile') and not episode.get('episodeFile', {}).get('qualityCutoffNotMet', False):
-                continue  # Episode has file and meets quality requirements
-            
-            # Check if episode aired but waiting for quality
-            air_date = episode.get('airDateUtc')
-            if air_date:
-                air_datetime = datetime.fromisoformat(air_date.replace('Z', '+00:00'))
-                if air_datetime < datetime.now(timezone.utc) - timedelta(days=7):  # Aired more than a week ago
-                    # Check if series is currently in the download queue (downloading, stuck, etc.)
-                    # If it's in the queue, don't send quality notification - the stuck monitor handles errors
-                    try:
-                        queue = await matched_sonarr._get("/queue")
-                        if queue and 'records' in queue:
-                            in_queue = any(
-                                item.get('seriesId') == series.get('id')
-                                for item in queue['records']
-                            )
-                            if in_queue:
-                                logger.info(f"Series '{request.title}' is in {matched_sonarr.instance_name} download queue - skipping quality notification")
-                                return
-                    except Exception as e:
-                        logger.warning(f"Failed to check {matched_sonarr.instance_name} queue for '{request.title}': {e}")
-                    
-                    # Check if we already notified about quality waiting
-                    if not self._already_notified_quality_wait(request, db):
-                        # Get quality profile name from series
-                        quality_profile_id = series.get('qualityProfileId')
-                        quality_profile_name = 'Unknown'
-                        
-                        # Try to get the actual profile name from Sonarr
-                        if quality_profile_id:
-                            # Quality profiles are in the series object as qualityProfile
-                            quality_obj = series.get('qualityProfile')
-                            if quality_obj and isinstance(quality_obj, dict):
-                                quality_profile_name = quality_obj.get('name', 'Unknown')
-                            else:
-                                # Look up profile name from Sonarr API
-                                try:
-                                    profiles = await matched_sonarr.get_quality_profiles()
-                                    profile = next((p for p in profiles if p.get('id') == quality_profile_id), None)
-                                    if profile:
-                                        quality_profile_name = profile.get('name', f"Profile ID {quality_profile_id}")
-                                    else:
-                                        quality_profile_name = f"Profile ID {quality_profile_id}"
-                                except Exception as e:
-                                    logger.error(f"Failed to lookup quality profile: {e}")
-                                    quality_profile_name = f"Profile ID {quality_profile_id}"
-                        
-                        await self._send_quality_waiting_notification(
-                            request=request,
-                            quality_profile_name=quality_profile_name,
-                            db=db
-                        )
-                        return  # Only send one notification per check
+        # An ended series with every monitored episode at cutoff won't change, so stop checking it
+        if series.get('status') == 'ended' and all(
+            episode.get('hasFile') and not episode.get('episodeFile', {}).get('qualityCutoffNotMet', False)
+            for episode in episodes if episode.get('monitored', True)
+        ):
+            self._mark_available(request)
+            return
+        
+        # Series-level state doesn't change between episodes, so resolve it once
+        # Check if series is currently in the download queue (downloading, stuck, etc.)
+        queued_series_ids = self.sonarr_queue_series_ids.get(matched_sonarr.instance_name, set())
+        in_sonarr_queue = series.get('id') in queued_series_ids
+        
+        quality_profile_name = self._resolve_profile_name(
+            series, self.sonarr_profiles.get(matched_sonarr.instance_name, {})
+        )
+        
+        # Find the first episode that aired more than a week ago without a file in acceptable quality
+        waiting_episode = next((ep for ep in episodes if needs_quality_wait(ep, self.aired_cutoff)), None)
+        if waiting_episode is None:
+            return
+        
+        # If it's in the queue, don't send quality notification - the stuck monitor handles errors
+        if in_sonarr_queue:
+            logger.info(f"Series '{request.title}' is in {matched_sonarr.instance_name} download queue - skipping quality notification")
+            return
+        
+        # Check if we already notified about quality waiting
+        if not self._already_notified_quality_wait(request, notified):
+            await self._send_quality_waiting_notification(
+                request=request,
+                quality_profile_name=quality_profile_name
+            )
     
-    async def _check_movie(self, request: MediaRequest, db: Session):
+    async def _check_movie(self, request: MediaRequest, notified: dict):
         """Check movie for release status and quality"""
-        # Get all movies from Radarr
-        movies = await self.radarr.get_movies()
-        
-        # Find movie by movie_id or TMDB ID
+        # Find movie by movie_id or TMDB ID in the Radarr library loaded for this run
         movie = None
         if hasattr(request, 'movie_id') and request.movie_id:
-            movie = next((m for m in movies if m.get('id') == request.movie_id), None)
+            movie = self.radarr_movies_by_id.get(request.movie_id)
         
         if not movie and request.tmdb_id:
             # Look up by TMDB ID
-            movie = next((m for m in movies if m.get('tmdbId') == request.tmdb_id), None)
+            movie = self.radarr_movies_by_tmdb.get(request.tmdb_id)
         
         if not movie:
             logger.info(f"Movie '{request.title}' (TMDB: {request.tmdb_id}) not yet in Radarr - skipping quality check")
@@ -205,13 +383,12 @@ class QualityReleaseMonitor:
             logger.info(f"Movie status '{status}' - Release date: {release_date}")
             
             if release_date:
-                release_datetime = datetime.fromisoformat(release_date.replace('Z', '+00:00'))
-                if release_datetime > datetime.now(timezone.utc):
+                if _parse_iso(release_date) > self.now:
                     logger.info(f"Movie not yet released - sending coming soon notification")
                     await self._send_coming_soon_notification(
                         request=request,
                         premiere_date=release_date,
-                        db=db
+                        notified=notified
                     )
                     return
                 else:
@@ -227,105 +404,50 @@ class QualityReleaseMonitor:
             
             if quality_cutoff_not_met:
                 logger.info(f"Movie has file but quality cutoff not met - sending quality waiting notification")
-                if not self._already_notified_quality_wait(request, db):
-                    # Get quality profile name from movie
-                    quality_profile_id = movie.get('qualityProfileId')
-                    quality_profile_name = 'Unknown'
-                    
-                    # Try to get the actual profile name
-                    quality_obj = movie.get('qualityProfile')
-                    if quality_obj and isinstance(quality_obj, dict):
-                        quality_profile_name = quality_obj.get('name', 'Unknown')
-                    elif quality_profile_id:
-                        # Look up profile name from Radarr API
-                        try:
-                            profiles = await self.radarr.get_quality_profiles()
-                            profile = next((p for p in profiles if p.get('id') == quality_profile_id), None)
-                            if profile:
-                                quality_profile_name = profile.get('name', f"Profile ID {quality_profile_id}")
-                            else:
-                                quality_profile_name = f"Profile ID {quality_profile_id}"
-                        except Exception as e:
-                            logger.error(f"Failed to lookup quality profile: {e}")
-                            quality_profile_name = f"Profile ID {quality_profile_id}"
-                    
+                if not self._already_notified_quality_wait(request, notified):
                     await self._send_quality_waiting_notification(
                         request=request,
-                        quality_profile_name=quality_profile_name,
-                        db=db
+                        quality_profile_name=self._resolve_profile_name(movie, self.radarr_profiles)
                     )
+            else:
+                self._mark_available(request)
         elif status in ['released', 'inCinemas']:
             # Movie is released/inCinemas but hasn't been downloaded yet - likely waiting for quality
             logger.info(f"Movie status '{status}' but no file - likely waiting for quality profile")
             
             # Check if movie is currently in the download queue (downloading, stuck, etc.)
             # If it's in the queue, don't send quality notification - the stuck monitor handles errors
-            try:
-                queue = await self.radarr._get("/queue")
-                if queue and 'records' in queue:
-                    in_queue = any(
-                        item.get('movieId') == movie.get('id')
-                        for item in queue['records']
-                    )
-                    if in_queue:
-                        logger.info(f"Movie '{request.title}' is in Radarr download queue - skipping quality notification")
-                        return
-            except Exception as e:
-                logger.warning(f"Failed to check Radarr queue for '{request.title}': {e}")
+            if movie.get('id') in self.radarr_queue_movie_ids:
+                logger.info(f"Movie '{request.title}' is in Radarr download queue - skipping quality notification")
+                return
             
-            already_notified = self._already_notified_quality_wait(request, db)
+            already_notified = self._already_notified_quality_wait(request, notified)
             logger.info(f"Already notified check: {already_notified}")
             
             if not already_notified:
-                # Get quality profile name from movie
-                quality_profile_id = movie.get('qualityProfileId')
-                quality_profile_name = 'Unknown'
-                
-                # Try to get the actual profile name
-                quality_obj = movie.get('qualityProfile')
-                if quality_obj and isinstance(quality_obj, dict):
-                    quality_profile_name = quality_obj.get('name', 'Unknown')
-                elif quality_profile_id:
-                    # Look up profile name from Radarr API
-                    try:
-                        profiles = await self.radarr.get_quality_profiles()
-                        profile = next((p for p in profiles if p.get('id') == quality_profile_id), None)
-                        if profile:
-                            quality_profile_name = profile.get('name', f"Profile ID {quality_profile_id}")
-                        else:
-                            quality_profile_name = f"Profile ID {quality_profile_id}"
-                    except Exception as e:
-                        logger.error(f"Failed to lookup quality profile: {e}")
-                        quality_profile_name = f"Profile ID {quality_profile_id}"
-                
                 await self._send_quality_waiting_notification(
                     request=request,
-                    quality_profile_name=quality_profile_name,
-                    db=db
+                    quality_profile_name=self._resolve_profile_name(movie, self.radarr_profiles)
                 )
     
     async def _send_coming_soon_notification(
         self, 
         request: MediaRequest, 
         premiere_date: str,
-        db: Session
+        notified: dict
     ):
-        """Send 'coming soon' notification with premiere date"""
+        """Queue 'coming soon' notification with premiere date"""
         
         # Check if we already sent this notification
-        if self._already_notified_coming_soon(request, db):
+        if self._already_notified_coming_soon(request, notified):
             return
         
         # Get poster
-        poster_url = None
-        if request.media_type == 'tv':
-            poster_url = await self.tmdb.get_tv_poster(request.tmdb_id)
-        else:
-            poster_url = await self.tmdb.get_movie_poster(request.tmdb_id)
+        poster_url = await self._get_poster(request)
         
         # Parse premiere date
         try:
-            premiere_datetime = datetime.fromisoformat(premiere_date.replace('Z', '+00:00'))
+            premiere_datetime = _parse_iso(premiere_date)
             formatted_date = premiere_datetime.strftime('%B %d, %Y')
         except:
             formatted_date = premiere_date
@@ -333,13 +455,14 @@ class QualityReleaseMonitor:
         # Get user
         user = request.user
         
-        # Create HTML email
-        html_body = self.email_service.render_coming_soon_notification(
+        # Create HTML email (rendered in a worker thread so other checks keep running)
+        html_body = await asyncio.get_running_loop().run_in_executor(None, partial(
+            self.email_service.render_coming_soon_notification,
             title=request.title,
             media_type=request.media_type,
             premiere_date=formatted_date,
             poster_url=poster_url
-        )
+        ))
         
         subject = f"Coming Soon: {request.title}"
         if request.media_type == 'movie':
@@ -347,60 +470,43 @@ class QualityReleaseMonitor:
         else:
             subject += f" - Premieres {formatted_date}"
         
-        # Create notification record
-        notification = Notification(
+        # Create notification record - the notification processor sends it,
+        # so a slow SMTP server doesn't hold up the remaining checks
+        now = datetime.now(timezone.utc)
+        self.new_notifications.append(dict(
             user_id=user.id,
             request_id=request.id,
             notification_type="coming_soon",
             subject=subject,
             body=html_body,
-            sent=False
-        )
-        db.add(notification)
-        db.commit()
+            sent=False,
+            send_after=now
+        ))  # Inserted with the rest of the run
+        notified[request.id]["coming_soon"] = now
         
-        # Send immediately
-        try:
-            await self.email_service.send_email(
-                to_email=user.email,
-                subject=subject,
-                html_body=html_body
-            )
-            notification.sent = True
-            notification.sent_at = datetime.now(timezone.utc)
-            db.commit()
-            
-            logger.info(f"Sent 'coming soon' notification for {request.title} to {user.email}")
-        except Exception as e:
-            logger.error(f"Failed to send coming soon notification: {e}")
-            notification.error_message = str(e)
-            db.commit()
+        logger.info(f"Queued 'coming soon' notification for {request.title} to {user.email}")
     
     async def _send_quality_waiting_notification(
         self,
         request: MediaRequest,
-        quality_profile_name: str,
-        db: Session
+        quality_profile_name: str
     ):
         """Send 'waiting for quality' notification"""
         
         # Get poster
-        poster_url = None
-        if request.media_type == 'tv':
-            poster_url = await self.tmdb.get_tv_poster(request.tmdb_id)
-        else:
-            poster_url = await self.tmdb.get_movie_poster(request.tmdb_id)
+        poster_url = await self._get_poster(request)
         
         # Get user
         user = request.user
         
-        # Create HTML email
-        html_body = self.email_service.render_quality_waiting_notification(
+        # Create HTML email (rendered in a worker thread so other checks keep running)
+        html_body = await asyncio.get_running_loop().run_in_executor(None, partial(
+            self.email_service.render_quality_waiting_notification,
             title=request.title,
             media_type=request.media_type,
             quality_profile=quality_profile_name,
             poster_url=poster_url
-        )
+        ))
         
         subject = f"Waiting for {quality_profile_name}: {request.title}"
         
@@ -410,7 +516,7 @@ class QualityReleaseMonitor:
         send_after = datetime.now(timezone.utc) + timedelta(seconds=settings.quality_waiting_delay_seconds)
         
         # Create notification record
-        notification = Notification(
+        self.new_notifications.append(dict(
             user_id=user.id,
             request_id=request.id,
             notification_type="quality_waiting",
@@ -418,48 +524,73 @@ class QualityReleaseMonitor:
             body=html_body,
             sent=False,
             send_after=send_after
-        )
-        db.add(notification)
-        db.commit()
+        ))  # Inserted with the rest of the run
         
         logger.info(f"Queued 'quality waiting' notification for {request.title} to {user.email}, will send after {send_after}")
         
         # Don't send immediately - let the notification processor handle it
         # This allows it to be cancelled if the movie downloads in correct quality before the delay expires
     
-    def _already_notified_coming_soon(self, request: MediaRequest, db: Session) -> bool:
-        """Check if we already sent a 'coming soon' notification for this request"""
-        # Only send once every 30 days
-        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    async def _get_poster(self, request: MediaRequest) -> Optional[str]:
+        """Get the poster URL for a request, served from cache when fresh"""
+        key = (request.media_type, request.tmdb_id)
+        cached = _poster_cache.get(key)
+        if cached and time.monotonic() - cached[1] < POSTER_CACHE_TTL_SECONDS:
+            return cached[0]
         
-        existing = db.query(Notification).filter(
-            Notification.request_id == request.id,
-            Notification.notification_type == "coming_soon",
-            Notification.sent == True,
-            Notification.sent_at > cutoff
-        ).first()
+        if request.media_type == 'tv':
+            poster_url = await self.tmdb.get_tv_poster(request.tmdb_id)
+        else:
+            poster_url = await self.tmdb.get_movie_poster(request.tmdb_id)
         
-        return existing is not None
+        if poster_url:  # Don't cache misses so they're retried next time
+            _poster_cache[key] = (poster_url, time.monotonic())
+        return poster_url
+    
+    @staticmethod
+    def _mark_available(request: MediaRequest):
+        """Exclude a request from future runs once its media is present at the quality cutoff"""
+        request.media_available = True
+        request.fulfilled_at = datetime.utcnow()
+        logger.info(f"'{request.title}' is available at its quality cutoff - no longer monitoring")
+    
+    @staticmethod
+    def _resolve_profile_name(item: dict, profile_map: dict) -> str:
+        """Get an *arr series/movie's quality profile name, from the embedded object or the run's profile map"""
+        quality_obj = item.get('qualityProfile')
+        if isinstance(quality_obj, dict) and quality_obj.get('name'):
+            return quality_obj['name']
+        quality_profile_id = item.get('qualityProfileId')
+        if not quality_profile_id:
+            return 'Unknown'
+        return profile_map.get(quality_profile_id) or f"Profile ID {quality_profile_id}"
+    
+    @staticmethod
+    def _sent_since(notified: dict, request_id: int, notification_type: str, cutoff: datetime) -> bool:
+        """Check the prefetched notified map for a notification sent after cutoff"""
+        last_sent_at = notified.get(request_id, {}).get(notification_type)
+        if last_sent_at is None:
+            return False
+        # sent_at is stored as naive UTC, but may be aware if set during this run
+        if last_sent_at.tzinfo is None:
+            last_sent_at = last_sent_at.replace(tzinfo=timezone.utc)
+        return last_sent_at > cutoff
+    
+    def _already_notified_coming_soon(self, request: MediaRequest, notified: dict) -> bool:
+        """Check if we already sent a 'coming soon' notification for this request"""
+        # Only send once every 30 days
+        return self._sent_since(notified, request.id, "coming_soon", self.coming_soon_cutoff)
     
-    def _already_notified_quality_wait(self, request: MediaRequest, db: Session) -> bool:
+    def _already_notified_quality_wait(self, request: MediaRequest, notified: dict) -> bool:
         """Check if we already sent a 'quality waiting' notification for this request"""
         # Only send once every 7 days
-        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
-        
-        existing = db.query(Notification).filter(
-            Notification.request_id == request.id,
-            Notification.notification_type == "quality_waiting",
-            Notification.sent == True,
-            Notification.sent_at > cutoff
-        ).first()
-        
-        return existing is not None
+        return self._sent_since(notified, request.id, "quality_waiting", self.quality_cutoff)
 
 
-async def run_quality_release_monitor():
+async def run_quality_release_monitor(request_ids: Optional[set] = None):
     """Entry point for background task"""
     monitor = QualityReleaseMonitor()
-    await monitor.run()
+    await monitor.run(request_ids)
 
 
 async def quality_release_monitor_worker():
@@ -469,23 +600,45 @@ async def quality_release_monitor_worker():
     
     logger.info("Quality/Release monitor worker started")
     
+    next_sweep = time.monotonic()  # Full sweep on startup
+    
     while True:
         try:
+            if time.monotonic() >= next_sweep:
+                if is_maintenance_active():
+                    logger.info("🔧 Maintenance active — skipping quality/release check")
+                elif settings.quality_monitor_enabled:
+                    await run_quality_release_monitor()
+                else:
+                    logger.debug("Quality monitoring is disabled in settings")
+                
+                # Schedule the next full sweep at the configured interval
+                next_sweep = time.monotonic() + settings.quality_monitor_interval_hours * 3600
+                logger.info(f"Next quality check in {settings.quality_monitor_interval_hours} hours")
+            
+            # Sleep until the next sweep, waking early for webhook-triggered re-checks
+            try:
+                request_id = await asyncio.wait_for(
+                    _recheck_queue.get(),
+                    timeout=max(0.0, next_sweep - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                continue
+            
+            # Drain the queue so a burst of webhooks becomes a single run
+            request_ids = {request_id}
+            while not _recheck_queue.empty():
+                request_ids.add(_recheck_queue.get_nowait())
+            
             if is_maintenance_active():
-                logger.info("🔧 Maintenance active — skipping quality/release check")
+                logger.info("🔧 Maintenance active — skipping quality re-check")
             elif settings.quality_monitor_enabled:
-                await run_quality_release_monitor()
-            else:
-                logger.debug("Quality monitoring is disabled in settings")
-            
-            # Wait configured interval before next check
-            interval_seconds = settings.quality_monitor_interval_hours * 3600
-            logger.info(f"Next quality check in {settings.quality_monitor_interval_hours} hours")
-            await asyncio.sleep(interval_seconds)
+                logger.info(f"Re-checking {len(request_ids)} request(s) after webhook")
+                await run_quality_release_monitor(request_ids)
         except Exception as e:
             logger.error(f"Quality/release monitor failed: {e}")
-            # Wait 1 hour on error before retrying
-            await asyncio.sleep(3600)
+            # Wait 1 hour on error before the next full sweep
+            next_sweep = time.monotonic() + 3600
 
 
 # For testing
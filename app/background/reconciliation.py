@@ -4,19 +4,181 @@ Runs periodically to check if downloads completed but notifications weren't sent
 """
 import asyncio
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import String, and_, case, cast, exists, literal, or_, select
+from sqlalchemy.orm import Session, load_only
 from app.database import SessionLocal, MediaRequest, EpisodeTracking, Notification, User
 from app.services.sonarr_service import SonarrService
 from app.services.radarr_service import RadarrService
 from app.services.plex_service import PlexService
-from app.services.email_service import EmailService
+from app.services.email_service import (
+    GROUPED_EPISODES_SUBJECT_SUFFIX, EmailService, episode_code, notification_episodes
+)
 from app.services.tmdb_service import TMDBService
 from app.config import settings
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sonarr library responses are reused within a run (and by back-to-back runs) for this long
+SONARR_CACHE_TTL_SECONDS = 120
+
+# Max per-series /episode requests in flight against one Sonarr instance
+SONARR_EPISODE_FETCH_CONCURRENCY = 8
+
+# Max Plex library lookups in flight at once
+PLEX_CHECK_CONCURRENCY = 8
+
+# How often the orphan pass also rechecks tracking rows already marked notified
+ORPHAN_FULL_SCAN_INTERVAL = timedelta(hours=24)
+_last_full_orphan_scan = None  # utcnow() of the last full orphan scan in this process
+
+# The MediaRequest columns the reconcile passes read
+_REQUEST_COLUMNS = load_only(MediaRequest.id, MediaRequest.user_id, MediaRequest.tmdb_id, MediaRequest.title)
+
+
+def _zero_pad(column):
+    """SQL equivalent of f"{value:02d}" for a non-negative integer column"""
+    as_text = cast(column, String)
+    return case((column < 10, literal("0").concat(as_text)), else_=as_text)
+
+
+# This tracking row's "SxxExx" code, as SQL
+_TRACKING_EPISODE_CODE = (
+    literal("S").concat(_zero_pad(EpisodeTracking.season_number))
+    .concat("E").concat(_zero_pad(EpisodeTracking.episode_number))
+)
+
+# True when the request's user already has an episode notification covering this tracking
+# row's episode: its code is in the subject, or in the body of a grouped notification whose
+# subject only gives a count (correlates to EpisodeTracking + MediaRequest)
+_HAS_EPISODE_NOTIFICATION = exists().where(
+    Notification.user_id == MediaRequest.user_id,
+    Notification.request_id == EpisodeTracking.request_id,
+    Notification.notification_type == "episode",
+    or_(
+        Notification.subject.contains(_TRACKING_EPISODE_CODE),
+        and_(
+            Notification.subject.endswith(GROUPED_EPISODES_SUBJECT_SUFFIX),
+            Notification.body.contains(_TRACKING_EPISODE_CODE)
+        )
+    )
+)
+
+
+def _load_orphaned_tracking(db: Session, full_scan: bool) -> list:
+    """Find tracked episodes with no matching episode notification, filtered in SQL.
+    
+    Only rows not yet marked notified are checked unless full_scan is set; the full
+    scan also catches rows marked notified whose notification was never created.
+    
+    Returns [(EpisodeTracking, MediaRequest or None)]; a None request means the
+    tracking row's request no longer exists.
+    """
+    query = db.query(EpisodeTracking, MediaRequest).outerjoin(
+        MediaRequest, MediaRequest.id == EpisodeTracking.request_id
+    ).filter(
+        ~_HAS_EPISODE_NOTIFICATION
+    )
+    if not full_scan:
+        query = query.filter(EpisodeTracking.notified == False)
+    return query.all()
+
+
+def _mark_notified_tracking(db: Session) -> int:
+    """Set notified on tracking rows that already have a notification but weren't marked"""
+    notified_ids = select(EpisodeTracking.id).join(
+        MediaRequest, MediaRequest.id == EpisodeTracking.request_id
+    ).where(
+        EpisodeTracking.notified == False,
+        _HAS_EPISODE_NOTIFICATION
+    )
+    return db.query(EpisodeTracking).filter(
+        EpisodeTracking.id.in_(notified_ids)
+    ).update({EpisodeTracking.notified: True}, synchronize_session=False)
+
+
+def _load_notified_episodes(db: Session, request_ids: set) -> set:
+    """Collect the given requests' episodes that already have an episode notification, in one query.
+    
+    Returns {(user_id, request_id, season_number, episode_number)}
+    """
+    if not request_ids:
+        return set()
+    notified = set()
+    rows = db.query(
+        Notification.user_id,
+        Notification.request_id,
+        Notification.subject,
+        # Bodies are only needed (and only loaded) for grouped notifications
+        case((Notification.subject.endswith(GROUPED_EPISODES_SUBJECT_SUFFIX), Notification.body))
+    ).filter(
+        Notification.notification_type == "episode",
+        Notification.request_id.in_(request_ids)
+    ).all()
+    for user_id, request_id, subject, body in rows:
+        for season_num, episode_num in notification_episodes(subject, body):
+            notified.add((user_id, request_id, season_num, episode_num))
+    return notified
+
+
+def _build_episode_notification(email_service: EmailService, request: MediaRequest, series: dict,
+                                episodes: list, poster_url: str, now: datetime) -> Notification:
+    """Create one notification covering all of a request's newly available episodes.
+    
+    A single episode keeps its code in the subject; several get a count in the subject
+    and are found through the body, which lists every episode code.
+    """
+    episodes = sorted(episodes, key=lambda ep: (ep['season'], ep['episode']))
+    if len(episodes) == 1:
+        subject = f"New Episode: {series.get('title')} {episode_code(episodes[0]['season'], episodes[0]['episode'])}"
+    else:
+        subject = f"New Episodes: {series.get('title')} ({len(episodes)}{GROUPED_EPISODES_SUBJECT_SUFFIX}"
+    html_body = email_service.render_episode_notification(
+        series_title=series.get("title"),
+        episodes=episodes,
+        poster_url=poster_url
+    )
+    return Notification(
+        user_id=request.user_id,
+        request_id=request.id,
+        notification_type="episode",
+        subject=subject,
+        body=html_body,
+        send_after=now,  # Send immediately
+        series_id=series.get("id")
+    )
+
+
+def _series_file_count(series: dict):
+    """Episode files Sonarr reports for a series in its /series statistics, or None if not included"""
+    return (series.get("statistics") or {}).get("episodeFileCount")
+
+
+async def _load_sonarr_series(sonarr_instances: list) -> list:
+    """Fetch /series once per Sonarr instance and index it for lookups.
+    
+    Returns [(sonarr, {series_id: series}, {tvdb_id: series}, {lowercase title: series})]
+    in instance order; instances that fail to respond are skipped.
+    """
+    indexed = []
+    for sonarr in sonarr_instances:
+        try:
+            series_list = await sonarr._get("/series", cache_ttl=SONARR_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to fetch series from {sonarr.instance_name}: {e}")
+            continue
+        
+        by_id = {}
+        by_tvdb = {}
+        by_title = {}
+        for s in series_list:
+            by_id[s.get("id")] = s
+            if s.get("tvdbId") is not None:
+                by_tvdb.setdefault(s.get("tvdbId"), s)
+            by_title.setdefault(s.get("title", "").lower(), s)
+        indexed.append((sonarr, by_id, by_tvdb, by_title))
+    return indexed
+
 
 async def reconcile_tv_episodes(db: Session):
     """Check for TV episodes that are downloaded but not notified"""
@@ -28,173 +190,257 @@ async def reconcile_tv_episodes(db: Session):
     email_service = EmailService()
     tmdb_service = TMDBService(settings.jellyseerr_url, settings.jellyseerr_api_key)
     
+    # Fetch each Sonarr library once for both passes below
+    sonarr_series = await _load_sonarr_series(sonarr_instances)
+    poster_cache = {}  # tmdb_id -> poster URL, shared by every episode of a series this run
+    now = datetime.utcnow()  # One timestamp for every notification this run (naive UTC, like the DB)
+    
+    # Plex results are reused for the rest of the run: the untracked pass checks a new
+    # episode twice, and an episode may come up in both passes
+    plex_results = {}  # (series_title, season, episode) -> in Plex
+    plex_semaphore = asyncio.Semaphore(PLEX_CHECK_CONCURRENCY)
+    
+    async def check_episode_in_plex(series_title, season_num, episode_num) -> bool:
+        key = (series_title, season_num, episode_num)
+        if key not in plex_results:
+            async with plex_semaphore:
+                plex_results[key] = await plex.check_episode_in_plex(series_title, season_num, episode_num)
+        return plex_results[key]
+    
+    async def prefetch_plex(keys):
+        """Run the Plex checks for these episodes concurrently so the loops below hit the cache.
+        
+        Failed checks are left uncached; they're retried (and logged) where the result is used.
+        """
+        pending = {key for key in keys if key not in plex_results}
+        await asyncio.gather(*(check_episode_in_plex(*key) for key in pending), return_exceptions=True)
+    
+    async def poster_for(tmdb_id):
+        if tmdb_id not in poster_cache:
+            poster_cache[tmdb_id] = await tmdb_service.get_tv_poster(tmdb_id)
+        return poster_cache[tmdb_id]
+    
+    def find_series(series_id):
+        for sonarr, by_id, by_tvdb, by_title in sonarr_series:
+            if series_id in by_id:
+                return by_id[series_id]
+        return None
+    
     # FIRST: Check for episodes that are tracked but never notified (missed webhooks!)
     logger.info("Checking for tracked episodes that never got notifications...")
     
-    # Check ALL tracking records - webhook might have marked notified=True but failed to create notification
-    all_tracking = db.query(EpisodeTracking).all()
+    # Check tracking records without a notification - webhook might have marked notified=True but failed to create notification
+    # (the bulk queries below run in a worker thread so they don't stall the event loop; the
+    # session is only ever used by this task, one call at a time)
+    
+    # Notification exists - mark tracking as notified if not already
+    marked_count = await asyncio.to_thread(_mark_notified_tracking, db)
+    if marked_count:
+        logger.info(f"Marked {marked_count} already-notified tracked episodes as notified")
+    
+    # Rows marked notified without a notification are rare (webhook failed midway), so
+    # they're only rechecked once per ORPHAN_FULL_SCAN_INTERVAL
+    global _last_full_orphan_scan
+    full_scan = _last_full_orphan_scan is None or now - _last_full_orphan_scan >= ORPHAN_FULL_SCAN_INTERVAL
+    orphaned_tracking = await asyncio.to_thread(_load_orphaned_tracking, db, full_scan)
+    if full_scan:
+        _last_full_orphan_scan = now
+    
+    logger.info(f"Found {len(orphaned_tracking)} tracked episodes without a notification")
     
-    logger.info(f"Found {len(all_tracking)} total tracked episodes, checking for missing notifications...")
+    orphan_keys = []
+    for tracking, request in orphaned_tracking:
+        series = find_series(tracking.series_id) if request else None
+        if series:
+            orphan_keys.append((series.get("title"), tracking.season_number, tracking.episode_number))
+    await prefetch_plex(orphan_keys)
     
     notifications_created = 0
     orphaned_count = 0
+    orphaned_in_plex = 0  # Orphaned episodes now in Plex, covered by the notifications below
+    orphan_groups = {}  # (user_id, request_id) -> (request, series, [episodes], [tracking rows])
     
-    for tracking in all_tracking:
+    for tracking, request in orphaned_tracking:
         try:
-            # Get the request for this tracking
-            request = db.query(MediaRequest).filter(
-                MediaRequest.id == tracking.request_id
-            ).first()
-            
             if not request:
                 logger.warning(f"Tracking {tracking.id} has no associated request - cleaning up")
                 db.delete(tracking)
                 continue
             
-            # Check if notification already exists
-            existing_notification = db.query(Notification).filter(
-                Notification.user_id == request.user_id,
-                Notification.request_id == request.id,
-                Notification.notification_type == "episode",
-                Notification.subject.contains(f"S{tracking.season_number:02d}E{tracking.episode_number:02d}")
-            ).first()
-            
-            if existing_notification:
-                # Notification exists - mark tracking as notified if not already
-                if not tracking.notified:
-                    tracking.notified = True
-                continue
-            
             # NO NOTIFICATION EXISTS! Orphaned episode
             orphaned_count += 1
-            logger.info(f"🎯 Orphaned: {request.title} S{tracking.season_number:02d}E{tracking.episode_number:02d} (notified={tracking.notified})")
+            logger.debug("🎯 Orphaned: %s S%02dE%02d (notified=%s)", request.title, tracking.season_number, tracking.episode_number, tracking.notified)
 
             
             # Get series info from Sonarr (check all instances)
-            series = None
-            for sonarr in sonarr_instances:
-                try:
-                    series_list = await sonarr._get("/series")
-                    for s in series_list:
-                        if s.get("id") == tracking.series_id:
-                            series = s
-                            break
-                    if series:
-                        break
-                except Exception:
-                    continue
+            series = find_series(tracking.series_id)
             
             if not series:
                 logger.warning(f"Series {tracking.series_id} not found in Sonarr - skipping")
                 continue
             
             # Check if episode is in Plex
-            in_plex = await plex.check_episode_in_plex(
+            in_plex = await check_episode_in_plex(
                 series.get("title"),
                 tracking.season_number,
                 tracking.episode_number
             )
             
             if not in_plex:
-                logger.info(f"  Episode NOT in Plex yet: {series.get('title')} S{tracking.season_number:02d}E{tracking.episode_number:02d} - will check next time")
+                logger.debug("  Episode NOT in Plex yet: %s S%02dE%02d - will check next time", series.get('title'), tracking.season_number, tracking.episode_number)
                 continue
             
-            logger.info(f"  ✅ Episode IS in Plex!")
-            
             # Episode is tracked, in Plex, but never notified - CREATE NOTIFICATION!
-            logger.info(f"🎯 Found orphaned episode: {series.get('title')} S{tracking.season_number:02d}E{tracking.episode_number:02d}")
-            
-            # Get poster
-            poster_url = await tmdb_service.get_tv_poster(request.tmdb_id)
-            
-            # Create notification
-            subject = f"New Episode: {series.get('title')} S{tracking.season_number:02d}E{tracking.episode_number:02d}"
-            html_body = email_service.render_episode_notification(
-                series_title=series.get("title"),
-                episodes=[{
-                    'season': tracking.season_number,
-                    'episode': tracking.episode_number,
-                    'title': tracking.episode_title or ""
-                }],
-                poster_url=poster_url
-            )
-            
-            notification = Notification(
-                user_id=request.user_id,
-                request_id=request.id,
-                notification_type="episode",
-                subject=subject,
-                body=html_body,
-                send_after=datetime.utcnow(),  # Send immediately
-                series_id=tracking.series_id
-            )
-            db.add(notification)
-            tracking.notified = True
-            notifications_created += 1
+            logger.debug("  ✅ Episode IS in Plex - queueing notification for %s S%02dE%02d", series.get('title'), tracking.season_number, tracking.episode_number)
+            
+            # Collected per request so each user gets one email per series
+            group = orphan_groups.setdefault((request.user_id, request.id), (request, series, [], []))
+            group[2].append({
+                'season': tracking.season_number,
+                'episode': tracking.episode_number,
+                'title': tracking.episode_title or ""
+            })
+            group[3].append(tracking)
+            orphaned_in_plex += 1
             
         except Exception as e:
             logger.error(f"Error processing orphaned tracking {tracking.id}: {e}")
             continue
     
+    # Fetch each show's poster once, concurrently (failures are retried below and logged per show)
+    await asyncio.gather(
+        *(poster_for(tmdb_id) for tmdb_id in {group[0].tmdb_id for group in orphan_groups.values()}),
+        return_exceptions=True
+    )
+    
+    for request, series, episodes, trackings in orphan_groups.values():
+        try:
+            poster_url = await poster_for(request.tmdb_id)
+            db.add(_build_episode_notification(email_service, request, series, episodes, poster_url, now))
+            # Only once the notification is queued, so a failure leaves these for the next run
+            for tracking in trackings:
+                tracking.notified = True
+            notifications_created += 1
+        except Exception as e:
+            logger.error(f"Error creating orphaned episode notification for {request.title}: {e}")
+    
     db.commit()
-    logger.info(f"Found {orphaned_count} orphaned episodes from tracking table, created {notifications_created} notifications")
+    logger.info(f"Found {orphaned_count} orphaned episodes from tracking table, created {notifications_created} notifications for {orphaned_in_plex} episodes in Plex")
     
     # SECOND: Check for new episodes that aren't tracked yet (original logic)
     logger.info("Checking for untracked downloaded episodes...")
     
     # Get all TV requests
-    tv_requests = db.query(MediaRequest).filter(
+    tv_requests = db.query(MediaRequest).options(_REQUEST_COLUMNS).filter(
         MediaRequest.media_type == "tv",
         MediaRequest.status == "approved"
     ).all()
     
     new_episodes_found = 0
+    new_notifications_created = 0
     
+    # Get series info from Sonarr (check all instances)
+    matched_requests = []  # (request, series, sonarr)
     for request in tv_requests:
+        title_key = request.title.lower()
+        for sonarr, by_id, by_tvdb, by_title in sonarr_series:
+            series = by_tvdb.get(request.tmdb_id) or by_title.get(title_key)
+            if series:
+                matched_requests.append((request, series, sonarr))
+                break
+    
+    # Episodes already notified for the matched requests (read after the orphan pass committed,
+    # so its notifications are included)
+    notified_episodes = await asyncio.to_thread(
+        _load_notified_episodes, db, {request.id for request, _, _ in matched_requests}
+    )
+    
+    # Get all episodes for the matched series, fetched concurrently per instance
+    episodes_by_instance = {}
+    for sonarr in sonarr_instances:
+        # Series with no episode files yet can't have missed notifications - skip their /episode call
+        series_ids = [
+            series["id"] for _, series, matched_sonarr in matched_requests
+            if matched_sonarr is sonarr and _series_file_count(series) != 0
+        ]
+        if series_ids:
+            episodes_by_instance[sonarr.instance_name] = await sonarr.get_episodes_for_series_ids(
+                series_ids,
+                concurrency=SONARR_EPISODE_FETCH_CONCURRENCY
+            )
+    
+    # Load existing tracking for all matched series in one query, reading only the columns
+    # needed here rather than building an ORM object per tracked episode
+    tracking_by_episode = {}  # (series_id, season, episode) -> tracking ID, or EpisodeTracking if created this run
+    notified_tracking = set()  # (series_id, season, episode) keys whose tracking is marked notified
+    matched_series_ids = {series["id"] for _, series, _ in matched_requests}
+    if matched_series_ids:
+        series_tracking = await asyncio.to_thread(lambda: db.execute(
+            select(
+                EpisodeTracking.id,
+                EpisodeTracking.series_id,
+                EpisodeTracking.season_number,
+                EpisodeTracking.episode_number,
+                EpisodeTracking.notified
+            ).where(EpisodeTracking.series_id.in_(matched_series_ids))
+        ).all())
+        for tracking_id, t_series_id, t_season, t_episode, t_notified in series_tracking:
+            key = (t_series_id, t_season, t_episode)
+            if key not in tracking_by_episode:
+                tracking_by_episode[key] = tracking_id
+                if t_notified:
+                    notified_tracking.add(key)
+    
+    # Plex checks for every downloaded episode that may still need a notification, run concurrently
+    untracked_keys = []
+    for request, series, matched_sonarr in matched_requests:
+        episodes = episodes_by_instance.get(matched_sonarr.instance_name, {}).get(series["id"]) or []
+        for e in episodes:
+            tracking_key = (series["id"], e.get("seasonNumber"), e.get("episodeNumber"))
+            if e.get("hasFile") and tracking_key not in notified_tracking:
+                untracked_keys.append((series.get("title"), e.get("seasonNumber"), e.get("episodeNumber")))
+    await prefetch_plex(untracked_keys)
+    
+    def mark_notified(key):
+        """Mark an episode's tracking notified (existing rows are updated in bulk per series)"""
+        notified_tracking.add(key)
+        marked_keys.append(key)
+        tracking = tracking_by_episode[key]
+        if isinstance(tracking, EpisodeTracking):
+            tracking.notified = True
+        else:
+            notified_ids.append(tracking)
+    
+    for request, series, matched_sonarr in matched_requests:
+        # New rows and tracking updates for this series, saved together in one savepoint per series
+        new_trackings = []
+        new_notifications = []
+        missed_episodes = []
+        notified_ids = []
+        marked_keys = []
         try:
-            # Get series info from Sonarr (check all instances)
-            series = None
-            matched_sonarr = sonarr_instances[0]
-            for sonarr in sonarr_instances:
-                try:
-                    series_list = await sonarr._get("/series")
-                    for s in series_list:
-                        if s.get("tvdbId") == request.tmdb_id or s.get("title", "").lower() == request.title.lower():
-                            series = s
-                            matched_sonarr = sonarr
-                            break
-                    if series:
-                        break
-                except Exception:
-                    continue
-            
-            if not series:
-                continue
-            
             series_id = series["id"]
+            episodes = episodes_by_instance.get(matched_sonarr.instance_name, {}).get(series_id)
+            if episodes is None:
+                continue  # No episode files yet, or the fetch failed (already logged) - retry next run
             
-            # Get all episodes for this series
-            episodes = await matched_sonarr._get(f"/episode?seriesId={series_id}")
+            # Only downloaded episodes (hasFile = False means not downloaded)
+            downloaded = [e for e in episodes if e.get("hasFile")]
+            if not downloaded:
+                continue  # Nothing downloaded yet - skip the Plex/TMDB work entirely
             
-            for episode in episodes:
-                # Skip if not downloaded (hasFile = False means not downloaded)
-                if not episode.get("hasFile"):
-                    continue
-                
+            for episode in downloaded:
                 season_num = episode.get("seasonNumber")
                 episode_num = episode.get("episodeNumber")
                 
                 # Check if we're tracking this episode
-                tracking = db.query(EpisodeTracking).filter(
-                    EpisodeTracking.series_id == series_id,
-                    EpisodeTracking.season_number == season_num,
-                    EpisodeTracking.episode_number == episode_num
-                ).first()
+                tracking_key = (series_id, season_num, episode_num)
+                tracking = tracking_by_episode.get(tracking_key)
                 
                 # If not tracking, check if it's in Plex (might have been imported before tracking started)
                 if not tracking:
                     # Check if episode is in Plex
-                    in_plex = await plex.check_episode_in_plex(
+                    in_plex = await check_episode_in_plex(
                         series.get("title"),
                         season_num,
                         episode_num
@@ -212,16 +458,16 @@ async def reconcile_tv_episodes(db: Session):
                         notified=False,
                         request_id=request.id
                     )
-                    db.add(tracking)
-                    db.commit()
-                    logger.info(f"Created tracking for episode: {series.get('title')} S{season_num:02d}E{episode_num:02d}")
+                    new_trackings.append(tracking)
+                    tracking_by_episode[tracking_key] = tracking
+                    logger.debug("Created tracking for episode: %s S%02dE%02d", series.get('title'), season_num, episode_num)
                 
                 # If already notified, skip
-                if tracking.notified:
+                if tracking_key in notified_tracking:
                     continue
                 
                 # Check if episode is actually in Plex
-                in_plex = await plex.check_episode_in_plex(
+                in_plex = await check_episode_in_plex(
                     series.get("title"),
                     season_num,
                     episode_num
@@ -231,59 +477,54 @@ async def reconcile_tv_episodes(db: Session):
                     continue  # Not in Plex yet, skip
                 
                 # Check if notification already exists
-                existing_notification = db.query(Notification).filter(
-                    Notification.user_id == request.user_id,
-                    Notification.request_id == request.id,
-                    Notification.notification_type == "episode",
-                    Notification.subject.contains(f"S{season_num:02d}E{episode_num:02d}")
-                ).first()
-                
-                if existing_notification:
+                episode_key = (request.user_id, request.id, season_num, episode_num)
+                if episode_key in notified_episodes:
                     # Notification exists but tracking wasn't marked - fix it
-                    tracking.notified = True
-                    db.commit()
+                    mark_notified(tracking_key)
                     continue
                 
                 # Missing notification! Episode is downloaded but never notified
-                logger.info(f"Found missed episode notification: {series.get('title')} S{season_num:02d}E{episode_num:02d}")
-                
-                # Get poster
-                poster_url = await tmdb_service.get_tv_poster(request.tmdb_id)
-                
-                # Create notification
-                subject = f"New Episode: {series.get('title')} S{season_num:02d}E{episode_num:02d}"
-                html_body = email_service.render_episode_notification(
-                    series_title=series.get("title"),
-                    episodes=[{
-                        'season': season_num,
-                        'episode': episode_num,
-                        'title': episode.get("title", "")
-                    }],
-                    poster_url=poster_url
-                )
+                logger.debug("Found missed episode notification: %s S%02dE%02d", series.get('title'), season_num, episode_num)
                 
-                notification = Notification(
-                    user_id=request.user_id,
-                    request_id=request.id,
-                    notification_type="episode",
-                    subject=subject,
-                    body=html_body,
-                    send_after=datetime.utcnow(),  # Send immediately
-                    series_id=series_id
-                )
-                db.add(notification)
-                tracking.notified = True
-                new_episodes_found += 1
-            
-            db.commit()
+                missed_episodes.append({
+                    'season': season_num,
+                    'episode': episode_num,
+                    'title': episode.get("title", "")
+                })
+                mark_notified(tracking_key)
+                notified_episodes.add(episode_key)
+            
+            if missed_episodes:
+                # One notification for all of this series' missed episodes
+                new_notifications.append(_build_episode_notification(
+                    email_service, request, series, missed_episodes, await poster_for(request.tmdb_id), now
+                ))
+            
+            # A failure rolls back only this series; the pass commits once at the end
+            with db.begin_nested():
+                if notified_ids:
+                    db.query(EpisodeTracking).filter(
+                        EpisodeTracking.id.in_(notified_ids)
+                    ).update({EpisodeTracking.notified: True}, synchronize_session=False)
+                db.add_all(new_trackings + new_notifications)
+            new_episodes_found += len(missed_episodes)
+            new_notifications_created += len(new_notifications)
             
         except Exception as e:
             logger.error(f"Error reconciling series {request.title}: {e}")
-            db.rollback()
+            # Forget rows that were rolled back so later series don't treat them as saved
+            for t in new_trackings:
+                tracking_by_episode.pop((t.series_id, t.season_number, t.episode_number), None)
+            notified_tracking.difference_update(marked_keys)
+            for n in new_notifications:
+                for season_num, episode_num in notification_episodes(n.subject, n.body):
+                    notified_episodes.discard((n.user_id, n.request_id, season_num, episode_num))
             continue
     
-    total_created = notifications_created + new_episodes_found
-    logger.info(f"TV reconciliation complete. Created {total_created} notifications ({notifications_created} orphaned + {new_episodes_found} new)")
+    db.commit()
+    
+    total_created = notifications_created + new_notifications_created
+    logger.info(f"TV reconciliation complete. Created {total_created} notifications ({notifications_created} orphaned + {new_notifications_created} new, covering {orphaned_in_plex + new_episodes_found} episodes)")
     return total_created
 
 
@@ -295,14 +536,19 @@ async def reconcile_movies(db: Session):
     plex = PlexService()
     email_service = EmailService()
     tmdb_service = TMDBService(settings.jellyseerr_url, settings.jellyseerr_api_key)
+    poster_cache = {}  # tmdb_id -> poster URL, for duplicate requests of the same movie
+    now = datetime.utcnow()  # One timestamp for every notification this run (naive UTC, like the DB)
     
     # Get all movie requests
-    movie_requests = db.query(MediaRequest).filter(
+    movie_requests = db.query(MediaRequest).options(_REQUEST_COLUMNS).filter(
         MediaRequest.media_type == "movie",
         MediaRequest.status == "approved"
     ).all()
     
     notifications_created = 0
+    movies_by_tmdb = None  # Radarr library, fetched on first need and indexed for lookups
+    movies_by_title = None
+    downloaded = []  # (request, movie) pairs that still need the Plex check
     
     for request in movie_requests:
         try:
@@ -317,12 +563,15 @@ async def reconcile_movies(db: Session):
                 continue  # Already notified
             
             # Get movie from Radarr
-            movies = await radarr._get("/movie")
-            movie = None
-            for m in movies:
-                if m.get("tmdbId") == request.tmdb_id or m.get("title", "").lower() == request.title.lower():
-                    movie = m
-                    break
+            if movies_by_tmdb is None:
+                movies = await radarr._get("/movie")
+                movies_by_tmdb = {}
+                movies_by_title = {}
+                for m in movies:
+                    if m.get("tmdbId") is not None:
+                        movies_by_tmdb.setdefault(m.get("tmdbId"), m)
+                    movies_by_title.setdefault(m.get("title", "").lower(), m)
+            movie = movies_by_tmdb.get(request.tmdb_id) or movies_by_title.get(request.title.lower())
             
             if not movie:
                 continue
@@ -331,20 +580,39 @@ async def reconcile_movies(db: Session):
             if not movie.get("hasFile"):
                 continue
             
-            # Check if in Plex
-            in_plex = await plex.check_movie_in_plex(
-                movie.get("title"),
-                movie.get("year")
-            )
+            downloaded.append((request, movie))
+            
+        except Exception as e:
+            logger.error(f"Error reconciling movie {request.title}: {e}")
+            continue
+    
+    # Check Plex for all downloaded movies concurrently
+    plex_semaphore = asyncio.Semaphore(PLEX_CHECK_CONCURRENCY)
+    
+    async def check_movie_in_plex(movie):
+        async with plex_semaphore:
+            return await plex.check_movie_in_plex(movie.get("title"), movie.get("year"))
+    
+    plex_results = await asyncio.gather(
+        *(check_movie_in_plex(movie) for _, movie in downloaded),
+        return_exceptions=True
+    )
+    
+    for (request, movie), in_plex in zip(downloaded, plex_results):
+        try:
+            if isinstance(in_plex, Exception):
+                raise in_plex
             
             if not in_plex:
                 continue  # Not in Plex yet
             
             # Missing notification! Movie is downloaded but never notified
-            logger.info(f"Found missed movie notification: {movie.get('title')} ({movie.get('year')})")
+            logger.debug("Found missed movie notification: %s (%s)", movie.get('title'), movie.get('year'))
             
             # Get poster
-            poster_url = await tmdb_service.get_movie_poster(request.tmdb_id)
+            if request.tmdb_id not in poster_cache:
+                poster_cache[request.tmdb_id] = await tmdb_service.get_movie_poster(request.tmdb_id)
+            poster_url = poster_cache[request.tmdb_id]
             
             # Create notification
             subject = f"New Movie: {movie.get('title')}"
@@ -360,17 +628,16 @@ async def reconcile_movies(db: Session):
                 notification_type="movie",
                 subject=subject,
                 body=html_body,
-                send_after=datetime.utcnow()  # Send immediately
+                send_after=now  # Send immediately
             )
             db.add(notification)
             notifications_created += 1
-            db.commit()
             
         except Exception as e:
             logger.error(f"Error reconciling movie {request.title}: {e}")
-            db.rollback()
             continue
     
+    db.commit()
     logger.info(f"Movie reconciliation complete. Created {notifications_created} missed notifications.")
     return notifications_created
 
@@ -419,30 +686,31 @@ async def reconcile_issues(db: Session):
     # Load configurable cutoffs
     recon_settings = get_reconciliation_settings()
     
-    fixing_cutoff = datetime.utcnow() - timedelta(hours=recon_settings['issue_fixing_cutoff_hours'])
-    reported_cutoff = datetime.utcnow() - timedelta(hours=recon_settings['issue_reported_cutoff_hours'])
-    stale_cutoff = datetime.utcnow() - timedelta(days=recon_settings['issue_abandon_days'])
-    
-    fixing_issues = db.query(ReportedIssue).filter(
-        ReportedIssue.status == "fixing",
-        ReportedIssue.updated_at < fixing_cutoff
-    ).all()
-    
-    reported_issues = db.query(ReportedIssue).filter(
-        ReportedIssue.status == "reported",
-        ReportedIssue.updated_at < reported_cutoff
-    ).all()
+    now = datetime.utcnow()
+    fixing_cutoff = now - timedelta(hours=recon_settings['issue_fixing_cutoff_hours'])
+    reported_cutoff = now - timedelta(hours=recon_settings['issue_reported_cutoff_hours'])
+    stale_cutoff = now - timedelta(days=recon_settings['issue_abandon_days'])
     
-    all_stale = fixing_issues + reported_issues
+    # Both stale groups in one query (each branch is a range scan on ix_issue_status_updated)
+    all_stale = db.query(ReportedIssue).filter(or_(
+        and_(ReportedIssue.status == "fixing", ReportedIssue.updated_at < fixing_cutoff),
+        and_(ReportedIssue.status == "reported", ReportedIssue.updated_at < reported_cutoff)
+    )).all()
     
     if not all_stale:
         logger.info("No stale issues found")
         return 0
     
-    logger.info(f"Found {len(fixing_issues)} fixing + {len(reported_issues)} reported stale issues to check")
+    fixing_count = sum(1 for issue in all_stale if issue.status == "fixing")
+    logger.info(f"Found {fixing_count} fixing + {len(all_stale) - fixing_count} reported stale issues to check")
+    
+    user_ids = {issue.user_id for issue in all_stale if issue.user_id}
+    users_map = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()} if user_ids else {}
     
     resolved_count = 0
     failed_count = 0
+    movies_by_tmdb = None  # Radarr/Sonarr libraries, fetched on first need and indexed for lookups
+    sonarr_series = None
     
     for issue in all_stale:
         try:
@@ -450,35 +718,44 @@ async def reconcile_issues(db: Session):
             
             if issue.media_type == "movie":
                 # Check Radarr for the movie file
-                movies = await radarr._get("/movie")
-                for m in movies:
-                    if m.get("tmdbId") == issue.tmdb_id and m.get("hasFile"):
-                        has_file = True
-                        break
+                if movies_by_tmdb is None:
+                    movies = await radarr._get("/movie")
+                    movies_by_tmdb = {}
+                    for m in movies:
+                        if m.get("tmdbId") is not None:
+                            movies_by_tmdb.setdefault(m.get("tmdbId"), m)
+                movie = movies_by_tmdb.get(issue.tmdb_id)
+                has_file = bool(movie and movie.get("hasFile"))
             else:
                 # For TV, check if any recent episode file exists across all Sonarr instances
-                for sonarr in sonarr_instances:
-                    try:
-                        series_list = await sonarr._get("/series")
-                        for s in series_list:
-                            if s.get("tvdbId") == issue.tmdb_id or s.get("title", "").lower() == issue.title.lower():
-                                episodes = await sonarr._get(f"/episode?seriesId={s['id']}")
-                                for ep in episodes:
-                                    if ep.get("hasFile"):
-                                        has_file = True
-                                        break
-                                break
-                        if has_file:
+                if sonarr_series is None:
+                    sonarr_series = await _load_sonarr_series(sonarr_instances)
+                title_key = issue.title.lower()
+                for sonarr, by_id, by_tvdb, by_title in sonarr_series:
+                    s = by_tvdb.get(issue.tmdb_id) or by_title.get(title_key)
+                    if not s:
+                        continue
+                    file_count = _series_file_count(s)
+                    if file_count is not None:
+                        if file_count > 0:
+                            has_file = True
                             break
+                        continue
+                    # No statistics in the payload - fall back to the episode list
+                    try:
+                        episodes = await sonarr._get(f"/episode?seriesId={s['id']}", cache_ttl=SONARR_CACHE_TTL_SECONDS)
                     except Exception:
                         continue
+                    if any(ep.get("hasFile") for ep in episodes):
+                        has_file = True
+                        break
             
             if has_file:
                 # Content is available — resolve the issue
                 logger.info(f"✅ Issue #{issue.seerr_issue_id} '{issue.title}' now has file — resolving")
                 
                 issue.status = "resolved"
-                issue.resolved_at = datetime.utcnow()
+                issue.resolved_at = now
                 issue.action_taken = issue.action_taken or "resolved_by_reconciliation"
                 
                 # Close in Seerr
@@ -497,7 +774,7 @@ async def reconcile_issues(db: Session):
                 # Send resolved email to user
                 if issue.user_id:
                     try:
-                        user = db.query(User).filter(User.id == issue.user_id).first()
+                        user = users_map.get(issue.user_id)
                         if user:
                             if issue.media_type == "movie":
                                 poster_url = await tmdb_service.get_movie_poster(issue.tmdb_id)
@@ -517,7 +794,7 @@ async def reconcile_issues(db: Session):
                                 notification_type="issue_resolved",
                                 subject=f"✅ Issue Resolved: {issue.title}",
                                 body=html_body,
-                                send_after=datetime.utcnow() + timedelta(seconds=300)
+                                send_after=now + timedelta(seconds=300)
                             )
                             db.add(notification)
                             logger.info(f"Queued 'Issue Resolved' notification for {user.email}")
@@ -542,17 +819,31 @@ async def reconcile_issues(db: Session):
     return resolved_count
 
 
+async def _run_with_session(reconcile):
+    """Run a reconcile function on its own session (a Session must not be shared between concurrent tasks)"""
+    db = SessionLocal()
+    try:
+        return await reconcile(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 async def run_reconciliation():
     """Main reconciliation task - runs periodically"""
     logger.info("=" * 60)
     logger.info("Starting reconciliation check...")
     logger.info("=" * 60)
     
-    db = SessionLocal()
     try:
-        tv_count = await reconcile_tv_episodes(db)
-        movie_count = await reconcile_movies(db)
-        issue_count = await reconcile_issues(db)
+        # TV and movies touch different services and rows, so run them side by side
+        tv_count, movie_count = await asyncio.gather(
+            _run_with_session(reconcile_tv_episodes),
+            _run_with_session(reconcile_movies)
+        )
+        issue_count = await _run_with_session(reconcile_issues)
         
         total = tv_count + movie_count
         if total > 0:
@@ -564,8 +855,6 @@ async def run_reconciliation():
         
     except Exception as e:
         logger.error(f"Reconciliation error: {e}")
-    finally:
-        db.close()
 
 
 async def reconciliation_worker():
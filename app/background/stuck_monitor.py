@@ -3,7 +3,12 @@ Stuck Download Monitor
 Monitors Sonarr/Radarr activity queues and alerts when downloads are stuck
 """
 import asyncio
+import json
+import re
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
+from jinja2 import Template
 from app.services.sonarr_service import SonarrService
 from app.services.radarr_service import RadarrService
 from app.services.email_service import EmailService
@@ -14,8 +19,114 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-# Track items we've already alerted about
-alerted_items = set()
+# Queue items with data that have been queued longer than this are considered stuck
+STUCK_AFTER_HOURS = 4
+
+# Sonarr status messages for an episode stuck on a TBA title ("TBA" is case-sensitive)
+TBA_MESSAGE_RE = re.compile(r'TBA|(?i:episode title)')
+
+# Track items we've already alerted about: alert key -> time.time() of the alert.
+# Each key expires ALERT_TTL_SECONDS after its own alert so the item can alert again;
+# oldest entries are dropped past the cap. Persisted in system_config so restarts
+# (and other app instances) don't re-alert
+alerted_items = {}
+ALERT_TTL_SECONDS = 24 * 60 * 60
+ALERTED_ITEMS_MAX_ENTRIES = 10000
+ALERTED_ITEMS_CONFIG_KEY = "stuck_monitor_alerted_items"
+
+# Series/movie names for the auto-fix report, cleared every 24 hours
+# (instance, endpoint, id) -> title; oldest entries are dropped past the cap
+_title_cache = {}
+TITLE_CACHE_MAX_ENTRIES = 4096
+
+
+def _already_alerted(alert_key) -> bool:
+    """True if we alerted about this key within the last ALERT_TTL_SECONDS"""
+    alerted_at = alerted_items.get(alert_key)
+    if alerted_at is None:
+        return False
+    if time.time() - alerted_at >= ALERT_TTL_SECONDS:
+        del alerted_items[alert_key]
+        return False
+    return True
+
+
+def _mark_alerted(alert_key):
+    """Record an alert for this key, starting its TTL"""
+    alerted_items.pop(alert_key, None)  # Re-insert so the dict stays oldest-first
+    if len(alerted_items) >= ALERTED_ITEMS_MAX_ENTRIES:
+        del alerted_items[next(iter(alerted_items))]
+    alerted_items[alert_key] = time.time()
+
+
+def _purge_expired_alerts():
+    """Drop alert keys whose TTL has passed (keys for items that left the queue are never re-checked)"""
+    cutoff = time.time() - ALERT_TTL_SECONDS
+    for alert_key in [k for k, alerted_at in alerted_items.items() if alerted_at <= cutoff]:
+        del alerted_items[alert_key]
+
+
+def _merge_saved_alerts(value: str):
+    """Merge a saved alert-key JSON blob into alerted_items, keeping the newer timestamp"""
+    for alert_key, alerted_at in json.loads(value).items():
+        if alerted_at > alerted_items.get(alert_key, 0):
+            alerted_items[alert_key] = alerted_at
+
+
+def _load_alerted_items():
+    """Merge alert keys saved by earlier runs (or other instances) into alerted_items"""
+    from app.database import SessionLocal, SystemConfig
+    
+    db = SessionLocal()
+    try:
+        config = db.query(SystemConfig).filter(SystemConfig.key == ALERTED_ITEMS_CONFIG_KEY).first()
+        if not config:
+            return
+        _merge_saved_alerts(config.value)
+    except Exception as e:
+        logger.warning(f"Failed to load saved stuck-download alerts: {e}")
+    finally:
+        db.close()
+    _purge_expired_alerts()
+
+
+def _save_alerted_items():
+    """Persist alerted_items so the next run (or another instance) skips these items.
+    
+    The row is locked and re-read first, so keys another instance saved since our
+    last load are merged in rather than overwritten.
+    """
+    from app.database import SessionLocal, SystemConfig
+    
+    db = SessionLocal()
+    try:
+        config = (
+            db.query(SystemConfig)
+            .filter(SystemConfig.key == ALERTED_ITEMS_CONFIG_KEY)
+            .with_for_update()
+            .first()
+        )
+        if config:
+            _merge_saved_alerts(config.value)
+            _purge_expired_alerts()
+            config.value = json.dumps(alerted_items)
+        else:
+            db.add(SystemConfig(key=ALERTED_ITEMS_CONFIG_KEY, value=json.dumps(alerted_items)))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Failed to save stuck-download alerts: {e}")
+    finally:
+        db.close()
+
+
+@lru_cache(maxsize=4096)
+def _parse_added(value: str) -> datetime:
+    """Parse a queue item's 'added' timestamp to naive UTC, cached since items stay queued across checks.
+    
+    fromisoformat accepts the *arr 'Z' suffix directly on Python 3.11+ (the image's version).
+    """
+    return datetime.fromisoformat(value).replace(tzinfo=None)
 
 
 def _is_import_failure(messages):
@@ -37,6 +148,31 @@ def _is_import_failure(messages):
     return False
 
 
+async def _fetch_titles(service, endpoint, ids):
+    """Look up titles for the given IDs concurrently, e.g. endpoint="/series".
+    
+    Returns {id: title}; IDs that fail to load are left out so callers keep their fallback.
+    """
+    instance = getattr(service, 'instance_name', type(service).__name__)
+    titles = {}
+    missing = []
+    for i in dict.fromkeys(ids):
+        cached = _title_cache.get((instance, endpoint, i))
+        if cached:
+            titles[i] = cached
+        else:
+            missing.append(i)
+    
+    results = await asyncio.gather(*(service._get(f"{endpoint}/{i}") for i in missing), return_exceptions=True)
+    for i, r in zip(missing, results):
+        if isinstance(r, dict) and r.get('title'):
+            titles[i] = r['title']
+            if len(_title_cache) >= TITLE_CACHE_MAX_ENTRIES:
+                del _title_cache[next(iter(_title_cache))]
+            _title_cache[(instance, endpoint, i)] = r['title']
+    return titles
+
+
 async def check_sonarr_queue(sonarr=None):
     """Check Sonarr queue for stuck downloads and auto-fix TBA titles"""
     if sonarr is None:
@@ -47,6 +183,7 @@ async def check_sonarr_queue(sonarr=None):
     
     stuck_items = []
     fixed_items = []
+    needs_title = []  # (fixed item, series ID) - titles are looked up together after the loop
     
     try:
         # Get queue from Sonarr
@@ -57,6 +194,7 @@ async def check_sonarr_queue(sonarr=None):
             return [], []
         
         now = datetime.utcnow()
+        stuck_cutoff = now - timedelta(hours=STUCK_AFTER_HOURS)
         
         for item in queue['records']:
             item_id = item.get('id')
@@ -72,14 +210,14 @@ async def check_sonarr_queue(sonarr=None):
                     messages.extend(msg.get('messages'))
             
             # Check for TBA title issue
-            has_tba_issue = any('TBA' in msg or 'episode title' in msg.lower() for msg in messages)
+            has_tba_issue = bool(messages) and TBA_MESSAGE_RE.search('\n'.join(messages)) is not None
             
             # Check for import failure using shared detection
             has_import_failure = _is_import_failure(messages)
             
             if has_import_failure and item_id:
                 alert_key = f"sonarr_{item_id}_import_fix"
-                if alert_key not in alerted_items:
+                if not _already_alerted(alert_key):
                     logger.warning(f"🔧 Found import failure in Sonarr: {title}")
                     
                     try:
@@ -95,24 +233,18 @@ async def check_sonarr_queue(sonarr=None):
                             await sonarr._post("/command", {"name": "SeriesSearch", "seriesId": series_id})
                             logger.info(f"✅ Triggered new search for series ID {series_id}")
                         
-                        # Get series name for the report
-                        series_title = title
-                        if series_id:
-                            try:
-                                series = await sonarr._get(f"/series/{series_id}")
-                                series_title = series.get('title', title)
-                            except Exception:
-                                pass
-                        
-                        fixed_items.append({
+                        fixed_item = {
                             'service': 'Sonarr',
-                            'series_title': series_title,
+                            'series_title': title,  # Replaced by the series name after the loop
                             'episode_title': title,
                             'action': 'Blocklist & Re-search',
                             'reason': 'Import failure — ' + (messages[0] if messages else 'No eligible files')
-                        })
+                        }
+                        fixed_items.append(fixed_item)
+                        if series_id:
+                            needs_title.append((fixed_item, series_id))
                         
-                        alerted_items.add(alert_key)
+                        _mark_alerted(alert_key)
                         logger.info(f"✅ Auto-fixed import failure for: {title}")
                         continue
                         
@@ -120,55 +252,55 @@ async def check_sonarr_queue(sonarr=None):
                         logger.error(f"Failed to auto-fix import failure: {e}")
             
             if has_tba_issue and series_id:
-                logger.warning(f"🔧 Found TBA title issue in Sonarr: {title}")
-                
-                try:
-                    # Trigger Series Refresh & Scan
-                    logger.info(f"Triggering Refresh & Scan for series ID {series_id}...")
+                alert_key = f"sonarr_{item_id}_tba_fixed"
+                # Already tried once: leave it to the stuck check below rather than refreshing every cycle
+                if not _already_alerted(alert_key):
+                    logger.warning(f"🔧 Found TBA title issue in Sonarr: {title}")
                     
-                    # Command to refresh series
-                    refresh_command = {
-                        "name": "RefreshSeries",
-                        "seriesId": series_id
-                    }
-                    await sonarr._post("/command", refresh_command)
-                    logger.info(f"✅ Refresh command sent for series ID {series_id}")
+                    try:
+                        # Trigger Series Refresh & Scan
+                        logger.info(f"Triggering Refresh & Scan for series ID {series_id}...")
                     
-                    # Wait a moment for refresh to start
-                    await asyncio.sleep(2)
+                        # Command to refresh series
+                        refresh_command = {
+                            "name": "RefreshSeries",
+                            "seriesId": series_id
+                        }
+                        await sonarr._post("/command", refresh_command)
+                        logger.info(f"✅ Refresh command sent for series ID {series_id}")
                     
-                    # Command to rescan series
-                    rescan_command = {
-                        "name": "RescanSeries",
-                        "seriesId": series_id
-                    }
-                    await sonarr._post("/command", rescan_command)
-                    logger.info(f"✅ Rescan command sent for series ID {series_id}")
+                        # Wait a moment for refresh to start
+                        await asyncio.sleep(2)
                     
-                    # Get series name
-                    series = await sonarr._get(f"/series/{series_id}")
-                    series_title = series.get('title', 'Unknown Series')
+                        # Command to rescan series
+                        rescan_command = {
+                            "name": "RescanSeries",
+                            "seriesId": series_id
+                        }
+                        await sonarr._post("/command", rescan_command)
+                        logger.info(f"✅ Rescan command sent for series ID {series_id}")
                     
-                    fixed_items.append({
-                        'service': 'Sonarr',
-                        'series_title': series_title,
-                        'episode_title': title,
-                        'action': 'Refresh & Scan',
-                        'reason': 'TBA title blocking import'
-                    })
+                        fixed_item = {
+                            'service': 'Sonarr',
+                            'series_title': 'Unknown Series',  # Replaced by the series name after the loop
+                            'episode_title': title,
+                            'action': 'Refresh & Scan',
+                            'reason': 'TBA title blocking import'
+                        }
+                        fixed_items.append(fixed_item)
+                        needs_title.append((fixed_item, series_id))
                     
-                    # Mark as alerted so we don't keep trying
-                    alert_key = f"sonarr_{item_id}_tba_fixed"
-                    alerted_items.add(alert_key)
+                        # Mark as alerted so we don't keep trying
+                        _mark_alerted(alert_key)
                     
-                    logger.info(f"✅ Auto-fixed TBA issue for: {series_title} - {title}")
+                        logger.info(f"✅ Auto-fixed TBA issue for series ID {series_id}: {title}")
                     
-                    # Don't add to stuck_items since we're fixing it
-                    continue
+                        # Don't add to stuck_items since we're fixing it
+                        continue
                     
-                except Exception as e:
-                    logger.error(f"Failed to auto-fix TBA issue: {e}")
-                    # Fall through to stuck_items if fix failed
+                    except Exception as e:
+                        logger.error(f"Failed to auto-fix TBA issue: {e}")
+                        # Fall through to stuck_items if fix failed
             
             # Check if stalled
             is_stalled = status in ['warning', 'stalled', 'failed']
@@ -177,16 +309,16 @@ async def check_sonarr_queue(sonarr=None):
             added_str = item.get('added')
             if added_str:
                 try:
-                    added = datetime.fromisoformat(added_str.replace('Z', '+00:00'))
-                    time_in_queue = (now - added.replace(tzinfo=None)).total_seconds() / 3600  # hours
+                    added = _parse_added(added_str)
                     
                     # Consider stuck if:
                     # 1. Status is warning/stalled/failed, OR
-                    # 2. Been in queue for more than 4 hours with no progress
-                    if is_stalled or (time_in_queue > 4 and item.get('size', 0) > 0):
+                    # 2. Been in queue for more than STUCK_AFTER_HOURS with no progress
+                    if is_stalled or (added < stuck_cutoff and item.get('size', 0) > 0):
+                        time_in_queue = (now - added).total_seconds() / 3600  # hours
                         # Only alert if we haven't already alerted for this item
                         alert_key = f"sonarr_{item_id}"
-                        if alert_key not in alerted_items:
+                        if not _already_alerted(alert_key):
                             stuck_items.append({
                                 'service': 'Sonarr',
                                 'title': title,
@@ -196,12 +328,18 @@ async def check_sonarr_queue(sonarr=None):
                                 'protocol': item.get('protocol', 'Unknown'),
                                 'download_client': item.get('downloadClient', 'Unknown')
                             })
-                            alerted_items.add(alert_key)
+                            _mark_alerted(alert_key)
                             logger.warning(f"Found stuck item in Sonarr: {title} ({status}, {time_in_queue:.1f}h in queue)")
                 
                 except Exception as e:
                     logger.error(f"Error parsing Sonarr item time: {e}")
         
+        # Series names for the auto-fix report
+        if needs_title:
+            titles = await _fetch_titles(sonarr, "/series", [sid for _, sid in needs_title])
+            for fixed_item, sid in needs_title:
+                fixed_item['series_title'] = titles.get(sid, fixed_item['series_title'])
+        
         return stuck_items, fixed_items
         
     except Exception as e:
@@ -216,6 +354,7 @@ async def check_radarr_queue():
     radarr = RadarrService()
     stuck_items = []
     fixed_items = []
+    needs_title = []  # (fixed item, movie ID) - titles are looked up together after the loop
     
     try:
         # Get queue from Radarr
@@ -226,6 +365,7 @@ async def check_radarr_queue():
             return [], []
         
         now = datetime.utcnow()
+        stuck_cutoff = now - timedelta(hours=STUCK_AFTER_HOURS)
         
         for item in queue['records']:
             item_id = item.get('id')
@@ -256,7 +396,7 @@ async def check_radarr_queue():
             
             if has_import_failure and item_id:
                 alert_key = f"radarr_{item_id}_import_fix"
-                if alert_key not in alerted_items:
+                if not _already_alerted(alert_key):
                     reason_msg = messages[0] if messages else 'Unable to import automatically'
                     logger.warning(f"🔧 Found import failure in Radarr: {title} — {reason_msg}")
                     
@@ -273,25 +413,19 @@ async def check_radarr_queue():
                             await radarr._post("/command", {"name": "MoviesSearch", "movieIds": [movie_id]})
                             logger.info(f"✅ Triggered new search for movie ID {movie_id}")
                         
-                        # Get movie name for the report
-                        movie_title = title
-                        if movie_id:
-                            try:
-                                movie = await radarr._get(f"/movie/{movie_id}")
-                                movie_title = movie.get('title', title)
-                            except Exception:
-                                pass
-                        
-                        fixed_items.append({
+                        fixed_item = {
                             'service': 'Radarr',
-                            'series_title': movie_title,
+                            'series_title': title,  # Replaced by the movie name after the loop
                             'episode_title': title,
                             'action': 'Blocklist & Re-search',
                             'reason': f'Import failure — {reason_msg}'
-                        })
+                        }
+                        fixed_items.append(fixed_item)
+                        if movie_id:
+                            needs_title.append((fixed_item, movie_id))
                         
-                        alerted_items.add(alert_key)
-                        logger.info(f"✅ Auto-fixed import failure for: {movie_title}")
+                        _mark_alerted(alert_key)
+                        logger.info(f"✅ Auto-fixed import failure for: {title}")
                         continue
                         
                     except Exception as e:
@@ -304,16 +438,16 @@ async def check_radarr_queue():
             added_str = item.get('added')
             if added_str:
                 try:
-                    added = datetime.fromisoformat(added_str.replace('Z', '+00:00'))
-                    time_in_queue = (now - added.replace(tzinfo=None)).total_seconds() / 3600  # hours
+                    added = _parse_added(added_str)
                     
                     # Consider stuck if:
                     # 1. Status is warning/stalled/failed, OR
-                    # 2. Been in queue for more than 4 hours with no progress
-                    if is_stalled or (time_in_queue > 4 and item.get('size', 0) > 0):
+                    # 2. Been in queue for more than STUCK_AFTER_HOURS with no progress
+                    if is_stalled or (added < stuck_cutoff and item.get('size', 0) > 0):
+                        time_in_queue = (now - added).total_seconds() / 3600  # hours
                         # Only alert if we haven't already alerted for this item
                         alert_key = f"radarr_{item_id}"
-                        if alert_key not in alerted_items:
+                        if not _already_alerted(alert_key):
                             stuck_items.append({
                                 'service': 'Radarr',
                                 'title': title,
@@ -323,12 +457,18 @@ async def check_radarr_queue():
                                 'protocol': item.get('protocol', 'Unknown'),
                                 'download_client': item.get('downloadClient', 'Unknown')
                             })
-                            alerted_items.add(alert_key)
+                            _mark_alerted(alert_key)
                             logger.warning(f"Found stuck item in Radarr: {title} ({status}, {time_in_queue:.1f}h in queue)")
                 
                 except Exception as e:
                     logger.error(f"Error parsing Radarr item time: {e}")
         
+        # Movie names for the auto-fix report
+        if needs_title:
+            titles = await _fetch_titles(radarr, "/movie", [mid for _, mid in needs_title])
+            for fixed_item, mid in needs_title:
+                fixed_item['series_title'] = titles.get(mid, fixed_item['series_title'])
+        
         return stuck_items, fixed_items
         
     except Exception as e:
@@ -336,47 +476,20 @@ async def check_radarr_queue():
         return [], []
 
 
-def generate_stuck_alert_email(stuck_items):
-    """Generate HTML email for stuck download alerts"""
-    
-    items_html = []
-    for item in stuck_items:
-        messages_html = ''
-        if item['messages']:
-            flat_messages = [msg for sublist in item['messages'] for msg in sublist]
-            if flat_messages:
-                messages_html = '<ul style="margin: 5px 0; padding-left: 20px; font-size: 13px;">'
-                for msg in flat_messages[:3]:  # Show first 3 messages
-                    messages_html += f'<li style="color: #f44336;">{msg}</li>'
-                messages_html += '</ul>'
-        
-        items_html.append(f'''
-            <div style="background: white; padding: 15px; margin-bottom: 15px; border-left: 4px solid #f44336; border-radius: 4px;">
-                <div style="font-weight: bold; color: #333; margin-bottom: 5px;">
-                    [{item['service']}] {item['title']}
-                </div>
-                <div style="font-size: 13px; color: #666;">
-                    <strong>Status:</strong> {item['status'].upper()} | 
-                    <strong>Time in Queue:</strong> {item['time_in_queue']} | 
-                    <strong>Client:</strong> {item['download_client']}
-                </div>
-                {messages_html}
-            </div>
-        ''')
-    
-    html = f'''
+# Compiled once at import; autoescape since queue titles and messages come from the *arr APIs
+_STUCK_ALERT_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; background-color: #f5f5f5; margin: 0; padding: 20px; }}
-            .container {{ max-width: 700px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            .header {{ background: linear-gradient(135deg, #f44336 0%, #d32f2f 100%); color: white; padding: 30px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 28px; }}
-            .header p {{ margin: 10px 0 0 0; opacity: 0.9; }}
-            .content {{ padding: 30px; }}
-            .footer {{ text-align: center; padding: 20px; font-size: 12px; color: #999; background: #f9f9f9; }}
-            .alert-icon {{ font-size: 48px; margin-bottom: 10px; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; background-color: #f5f5f5; margin: 0; padding: 20px; }
+            .container { max-width: 700px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            .header { background: linear-gradient(135deg, #f44336 0%, #d32f2f 100%); color: white; padding: 30px; text-align: center; }
+            .header h1 { margin: 0; font-size: 28px; }
+            .header p { margin: 10px 0 0 0; opacity: 0.9; }
+            .content { padding: 30px; }
+            .footer { text-align: center; padding: 20px; font-size: 12px; color: #999; background: #f9f9f9; }
+            .alert-icon { font-size: 48px; margin-bottom: 10px; }
         </style>
     </head>
     <body>
@@ -384,14 +497,24 @@ def generate_stuck_alert_email(stuck_items):
             <div class="header">
                 <div class="alert-icon">⚠️</div>
                 <h1>Stuck Downloads Alert</h1>
-                <p>{len(stuck_items)} item{'s' if len(stuck_items) != 1 else ''} stuck in download queue</p>
+                <p>{{ items|length }} item{{ 's' if items|length != 1 else '' }} stuck in download queue</p>
             </div>
             
             <div class="content">
                 <p>The following downloads appear to be stuck and may need your attention:</p>
-                
-                {''.join(items_html)}
-                
+                {% for item in items %}
+            <div style="background: white; padding: 15px; margin-bottom: 15px; border-left: 4px solid #f44336; border-radius: 4px;">
+                <div style="font-weight: bold; color: #333; margin-bottom: 5px;">
+                    [{{ item.service }}] {{ item.title }}
+                </div>
+                <div style="font-size: 13px; color: #666;">
+                    <strong>Status:</strong> {{ item.status|upper }} | 
+                    <strong>Time in Queue:</strong> {{ item.time_in_queue }} | 
+                    <strong>Client:</strong> {{ item.download_client }}
+                </div>
+                {% if item.messages %}<ul style="margin: 5px 0; padding-left: 20px; font-size: 13px;">{% for msg in item.messages %}<li style="color: #f44336;">{{ msg }}</li>{% endfor %}</ul>{% endif %}
+            </div>
+                {% endfor %}
                 <p style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #eee; font-size: 14px; color: #666;">
                     <strong>What to do:</strong><br>
                     • Check your download client for errors<br>
@@ -403,14 +526,26 @@ def generate_stuck_alert_email(stuck_items):
             
             <div class="footer">
                 <p>This is an automated alert from your BingeAlert</p>
-                <p>Generated on {datetime.utcnow().strftime('%B %d, %Y at %I:%M %p')} UTC</p>
+                <p>Generated on {{ generated_at }} UTC</p>
             </div>
         </div>
     </body>
     </html>
-    '''
+    """, autoescape=True)
+
+
+def generate_stuck_alert_email(stuck_items):
+    """Generate HTML email for stuck download alerts"""
+    items = []
+    for item in stuck_items:
+        flat_messages = [msg for sublist in item['messages'] for msg in sublist] if item['messages'] else []
+        items.append(dict(item, messages=flat_messages[:3]))  # Show first 3 messages
     
-    return html
+    return _STUCK_ALERT_TEMPLATE.render(
+        items=items,
+        generated_at=datetime.utcnow().strftime('%B %d, %Y at %I:%M %p')
+    )
+
 
 
 async def check_and_alert_stuck_downloads():
@@ -420,19 +555,29 @@ async def check_and_alert_stuck_downloads():
     logger.info("=" * 60)
     
     try:
-        # Check all Sonarr instances (primary + anime if configured)
+        # Pick up alerts recorded since the last check (restart or another instance)
+        await asyncio.to_thread(_load_alerted_items)
+        
+        # Check all Sonarr instances (primary + anime if configured) and Radarr concurrently
         from app.services.sonarr_service import get_all_sonarr_instances
-        sonarr_stuck = []
-        sonarr_fixed = []
-        for sonarr_instance in get_all_sonarr_instances():
-            s, f = await check_sonarr_queue(sonarr_instance)
-            sonarr_stuck.extend(s)
-            sonarr_fixed.extend(f)
+        results = await asyncio.gather(
+            *(check_sonarr_queue(sonarr_instance) for sonarr_instance in get_all_sonarr_instances()),
+            check_radarr_queue(),
+            return_exceptions=True
+        )
         
-        radarr_stuck, radarr_fixed = await check_radarr_queue()
+        all_stuck = []
+        all_fixed = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Queue check failed: {result}")
+                continue
+            stuck, fixed = result
+            all_stuck.extend(stuck)
+            all_fixed.extend(fixed)
         
-        all_stuck = sonarr_stuck + radarr_stuck
-        all_fixed = sonarr_fixed + radarr_fixed
+        if all_stuck or all_fixed:
+            await asyncio.to_thread(_save_alerted_items)
         
         email_service = EmailService()
         admin_email = settings.admin_email or settings.smtp_from
@@ -468,38 +613,20 @@ async def check_and_alert_stuck_downloads():
         logger.error(f"Failed to check stuck downloads: {e}")
 
 
-def generate_auto_fix_email(fixed_items):
-    """Generate HTML email for auto-fixed stuck imports"""
-    
-    items_html = []
-    for item in fixed_items:
-        items_html.append(f'''
-            <div style="background: white; padding: 15px; margin-bottom: 15px; border-left: 4px solid #4caf50; border-radius: 4px;">
-                <div style="font-weight: bold; color: #333; margin-bottom: 5px;">
-                    [{item['service']}] {item['series_title']}
-                </div>
-                <div style="font-size: 13px; color: #666; margin-bottom: 5px;">
-                    <strong>Release:</strong> {item['episode_title']}
-                </div>
-                <div style="font-size: 13px; color: #4caf50;">
-                    ✅ <strong>Action Taken:</strong> {item['action']} — {item['reason']}
-                </div>
-            </div>
-        ''')
-    
-    html = f'''
+# Compiled once at import; autoescape since release and series titles come from the *arr APIs
+_AUTO_FIX_TEMPLATE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; background-color: #f5f5f5; margin: 0; padding: 20px; }}
-            .container {{ max-width: 700px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            .header {{ background: linear-gradient(135deg, #4caf50 0%, #45a049 100%); color: white; padding: 30px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 28px; }}
-            .header p {{ margin: 10px 0 0 0; opacity: 0.9; }}
-            .content {{ padding: 30px; }}
-            .footer {{ text-align: center; padding: 20px; font-size: 12px; color: #999; background: #f9f9f9; }}
-            .success-icon {{ font-size: 48px; margin-bottom: 10px; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; background-color: #f5f5f5; margin: 0; padding: 20px; }
+            .container { max-width: 700px; margin: 0 auto; background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            .header { background: linear-gradient(135deg, #4caf50 0%, #45a049 100%); color: white; padding: 30px; text-align: center; }
+            .header h1 { margin: 0; font-size: 28px; }
+            .header p { margin: 10px 0 0 0; opacity: 0.9; }
+            .content { padding: 30px; }
+            .footer { text-align: center; padding: 20px; font-size: 12px; color: #999; background: #f9f9f9; }
+            .success-icon { font-size: 48px; margin-bottom: 10px; }
         </style>
     </head>
     <body>
@@ -507,14 +634,24 @@ def generate_auto_fix_email(fixed_items):
             <div class="header">
                 <div class="success-icon">✅</div>
                 <h1>Stuck Imports Auto-Fixed</h1>
-                <p>{len(fixed_items)} item{'s' if len(fixed_items) != 1 else ''} automatically remediated</p>
+                <p>{{ items|length }} item{{ 's' if items|length != 1 else '' }} automatically remediated</p>
             </div>
             
             <div class="content">
                 <p>The following downloads were stuck due to import failures. BingeAlert automatically <strong>removed the stuck item, blocklisted the release, and triggered a new search</strong> for a different version:</p>
-                
-                {''.join(items_html)}
-                
+                {% for item in items %}
+            <div style="background: white; padding: 15px; margin-bottom: 15px; border-left: 4px solid #4caf50; border-radius: 4px;">
+                <div style="font-weight: bold; color: #333; margin-bottom: 5px;">
+                    [{{ item.service }}] {{ item.series_title }}
+                </div>
+                <div style="font-size: 13px; color: #666; margin-bottom: 5px;">
+                    <strong>Release:</strong> {{ item.episode_title }}
+                </div>
+                <div style="font-size: 13px; color: #4caf50;">
+                    ✅ <strong>Action Taken:</strong> {{ item.action }} — {{ item.reason }}
+                </div>
+            </div>
+                {% endfor %}
                 <p style="margin-top: 20px; padding-top: 20px; border-top: 1px solid #eee; font-size: 14px; color: #666;">
                     <strong>What happened:</strong><br>
                     • Detected stuck imports that couldn't be processed automatically<br>
@@ -526,14 +663,21 @@ def generate_auto_fix_email(fixed_items):
             
             <div class="footer">
                 <p>This is an automated fix from your BingeAlert</p>
-                <p>Generated on {datetime.utcnow().strftime('%B %d, %Y at %I:%M %p')} UTC</p>
+                <p>Generated on {{ generated_at }} UTC</p>
             </div>
         </div>
     </body>
     </html>
-    '''
-    
-    return html
+    """, autoescape=True)
+
+
+def generate_auto_fix_email(fixed_items):
+    """Generate HTML email for auto-fixed stuck imports"""
+    return _AUTO_FIX_TEMPLATE.render(
+        items=fixed_items,
+        generated_at=datetime.utcnow().strftime('%B %d, %Y at %I:%M %p')
+    )
+
 
 
 async def stuck_download_monitor():
@@ -542,7 +686,7 @@ async def stuck_download_monitor():
     
     logger.info("⚠️ Stuck download monitor started - will check every 30 minutes")
     
-    # Clear alerted items every 24 hours so we can re-alert
+    # Clear the title cache every 24 hours (alert keys expire individually)
     last_clear = datetime.utcnow()
     
     while True:
@@ -553,11 +697,12 @@ async def stuck_download_monitor():
                 # Check for stuck downloads
                 await check_and_alert_stuck_downloads()
             
-            # Clear alert cache every 24 hours
+            _purge_expired_alerts()
+            
+            # Clear title cache every 24 hours
             now = datetime.utcnow()
             if (now - last_clear).total_seconds() > 86400:  # 24 hours
-                logger.info("Clearing alert cache (24h reset)")
-                alerted_items.clear()
+                _title_cache.clear()
                 last_clear = now
             
         except Exception as e:
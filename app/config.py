@@ -10,6 +10,9 @@ class Settings(BaseSettings):
     db_name: str = "notifications"
     db_host: str = "postgres"
     db_port: int = 5432
+    db_pool_size: int = 10  # Persistent connections kept open by the engine
+    db_max_overflow: int = 20  # Extra connections allowed under burst load
+    db_pool_recycle_seconds: int = 1800  # Recycle connections before server-side idle timeouts
     
     # Jellyseerr
     jellyseerr_url: str
@@ -45,6 +48,8 @@ class Settings(BaseSettings):
     quality_monitor_enabled: bool = True  # Monitor for unreleased content and quality mismatches
     quality_monitor_interval_hours: int = 24  # How often to check (in hours)
     quality_waiting_delay_seconds: int = 300  # Delay before sending quality waiting emails (allows cancellation)
+    quality_monitor_concurrency: int = 10  # Max requests checked in parallel against Sonarr/Radarr
+    quality_monitor_min_recheck_minutes: int = 60  # Skip requests checked more recently than this in a full sweep
     
     # Issue Auto-fix: 'manual', 'auto', 'auto_notify'
     issue_autofix_mode: str = "manual"  # manual = admin reviews, auto = auto blacklist+research, auto_notify = auto + email admin
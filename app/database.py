@@ -1,11 +1,17 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, UniqueConstraint, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 
 from app.config import settings
 
-engine = create_engine(settings.database_url)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,  # Transparently replace connections dropped by Postgres restarts
+    pool_recycle=settings.db_pool_recycle_seconds,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -61,6 +67,12 @@ class MediaRequest(Base):
     # For TV shows
     season_count = Column(Integer, nullable=True)
     
+    # Last time the quality/release monitor checked this request
+    last_monitored_at = Column(DateTime, nullable=True)
+    # Set once the monitor sees every file present at the profile's quality cutoff
+    media_available = Column(Boolean, nullable=False, default=False, server_default='false')
+    fulfilled_at = Column(DateTime, nullable=True)
+    
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -69,6 +81,11 @@ class MediaRequest(Base):
     episodes = relationship("EpisodeTracking", back_populates="request")
     notifications = relationship("Notification", back_populates="request")
     shared_with = relationship("SharedRequest", back_populates="request", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Quality monitor's pending-request scan
+        Index('ix_media_requests_monitor', 'status', 'media_available', 'last_monitored_at'),
+    )
 
 
 class SharedRequest(Base):
@@ -109,6 +126,8 @@ class EpisodeTracking(Base):
     
     __table_args__ = (
         UniqueConstraint('request_id', 'series_id', 'season_number', 'episode_number', name='_request_series_season_episode_uc'),
+        # Episode lookups by series (reconciliation, webhooks) regardless of request
+        Index('ix_ep_tracking_sid_s_e', 'series_id', 'season_number', 'episode_number'),
     )
 
 
@@ -135,6 +154,11 @@ class ReportedIssue(Base):
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     request = relationship("MediaRequest")
+    
+    __table_args__ = (
+        # Stale-issue scan (reconciliation): status match plus updated_at range
+        Index('ix_issue_status_updated', 'status', 'updated_at'),
+    )
 
 
 class MaintenanceWindow(Base):
@@ -174,3 +198,10 @@ class Notification(Base):
     # Relationships
     user = relationship("User", back_populates="notifications")
     request = relationship("MediaRequest", back_populates="notifications")
+    
+    __table_args__ = (
+        # "Already sent recently?" lookups (quality monitor); partial on Postgres
+        Index('ix_notif_sent_recent', 'request_id', 'notification_type', 'sent_at', postgresql_where=text('sent = true')),
+        # "Already notified?" lookups per user/request (reconciliation, webhooks)
+        Index('ix_notif_user_req_type', 'user_id', 'request_id', 'notification_type'),
+    )
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
 import os
 import ipaddress
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 import logging
 from datetime import datetime
@@ -8,13 +9,49 @@ from typing import List
 
 from app.database import get_db, MediaRequest, EpisodeTracking, Notification, User
 from app.schemas import SonarrWebhook, RadarrWebhook, WebhookResponse
-from app.services.email_service import EmailService
+from app.services.email_service import GROUPED_EPISODES_SUBJECT_SUFFIX, EmailService, episode_code
 from app.services.sonarr_service import SonarrService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Parsed WEBHOOK_ALLOWED_IPS, keyed by the raw env value so edits saved from
+# the admin config page (which rewrite os.environ) are picked up automatically
+_ALLOWED_IPS_CACHE = {}
+
+
+def _parse_allowed_ips(allowed: str):
+    """Parse a WEBHOOK_ALLOWED_IPS value into (exact IPs, IPv4 networks, IPv6 networks)"""
+    cached = _ALLOWED_IPS_CACHE.get(allowed)
+    if cached is not None:
+        return cached
+
+    exact = set()
+    v4_networks = []
+    v6_networks = []
+    for allowed_ip in (ip.strip() for ip in allowed.split(",")):
+        if not allowed_ip:
+            continue
+        if "/" not in allowed_ip:
+            exact.add(allowed_ip)
+            continue
+        try:
+            network = ipaddress.ip_network(allowed_ip, strict=False)
+        except ValueError:
+            logger.warning(f"Ignoring invalid network in WEBHOOK_ALLOWED_IPS: {allowed_ip}")
+            continue
+        if network.version == 4:
+            v4_networks.append(network)
+        else:
+            v6_networks.append(network)
+
+    parsed = (frozenset(exact), tuple(v4_networks), tuple(v6_networks))
+    _ALLOWED_IPS_CACHE.clear()  # Only the current env value is ever needed
+    _ALLOWED_IPS_CACHE[allowed] = parsed
+    return parsed
+
+
 def _check_webhook_ip(request: Request):
     """
     SECURITY FIX [HIGH-1]: Validate webhook source IP.
@@ -26,17 +63,17 @@ def _check_webhook_ip(request: Request):
         return
     from app.auth import get_client_ip
     client_ip = get_client_ip(request)
-    allowed_list = [ip.strip() for ip in allowed.split(",") if ip.strip()]
-    for allowed_ip in allowed_list:
-        try:
-            if "/" in allowed_ip:
-                if ipaddress.ip_address(client_ip) in ipaddress.ip_network(allowed_ip, strict=False):
-                    return
-            else:
-                if client_ip == allowed_ip:
-                    return
-        except ValueError:
-            continue
+    exact, v4_networks, v6_networks = _parse_allowed_ips(allowed)
+    if client_ip in exact:
+        return
+    try:
+        ip = ipaddress.ip_address(client_ip)
+    except ValueError:
+        ip = None
+    if ip is not None:
+        networks = v4_networks if ip.version == 4 else v6_networks
+        if any(ip in network for network in networks):
+            return
     logger.warning(f"Webhook rejected: IP {client_ip} not in allowed list")
     raise HTTPException(status_code=403, detail="Forbidden")
 
@@ -171,12 +208,20 @@ async def sonarr_webhook(
                     episode_tracking.episode_title = episode.title
                 
                 # Now notify all users
+                code = episode_code(episode.seasonNumber, episode.episodeNumber)
                 for user in users_to_notify:
                     existing_notification = db.query(Notification).filter(
                         Notification.user_id == user.id,
                         Notification.request_id == request.id,
                         Notification.notification_type == "episode",
-                        Notification.subject.contains(f"S{episode.seasonNumber:02d}E{episode.episodeNumber:02d}")
+                        # Grouped notifications ("(N episodes)") list their codes in the body
+                        or_(
+                            Notification.subject.contains(code),
+                            and_(
+                                Notification.subject.endswith(GROUPED_EPISODES_SUBJECT_SUFFIX),
+                                Notification.body.contains(code)
+                            )
+                        )
                     ).first()
                     
                     # Only add to batch if not already notified
@@ -249,9 +294,9 @@ async def sonarr_webhook(
             # Create subject based on episode count
             if len(batch['episodes']) == 1:
                 ep = batch['episodes'][0]
-                subject = f"New Episode: {webhook.series.title} S{ep['season']:02d}E{ep['episode']:02d}"
+                subject = f"New Episode: {webhook.series.title} {episode_code(ep['season'], ep['episode'])}"
             else:
-                subject = f"New Episodes: {webhook.series.title} ({len(batch['episodes'])} episodes)"
+                subject = f"New Episodes: {webhook.series.title} ({len(batch['episodes'])}{GROUPED_EPISODES_SUBJECT_SUFFIX}"
             
             # Set send_after to 7 minutes from now (420 seconds)
             # This gives time for: 2 min batch window + 5 min Plex indexing
@@ -289,6 +334,11 @@ async def sonarr_webhook(
                 db.rollback()
                 raise
         
+        # Re-run the quality check for these requests now rather than at the next sweep
+        from app.background.quality_monitor import request_quality_recheck
+        for media_request in requests:
+            request_quality_recheck(media_request.id)
+        
         # Check if this download resolves any reported issues
         background_tasks.add_task(_check_issue_resolution, webhook.series.tmdbId, "tv")
         
@@ -459,6 +509,11 @@ async def radarr_webhook(
         
         db.commit()
         
+        # Re-run the quality check for these requests now rather than at the next sweep
+        from app.background.quality_monitor import request_quality_recheck
+        for media_request in requests:
+            request_quality_recheck(media_request.id)
+        
         # Check if this download resolves any reported issues
         background_tasks.add_task(_check_issue_resolution, webhook.movie.tmdbId, "movie")
         
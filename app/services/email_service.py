@@ -2,15 +2,48 @@ import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from jinja2 import Template
+from sqlalchemy import update
 import logging
+import re
 from typing import List
 from datetime import datetime
+from functools import lru_cache
 
 from app.config import settings
 from app.database import Notification
 
 logger = logging.getLogger(__name__)
 
+# Movie/other sends are marked sent in batches of this size (and whenever the loop exits), so
+# even a killed process leaves at most this many delivered emails unmarked
+SEND_RESULTS_FLUSH_EVERY = 10
+
+# Episode codes in notification subjects, e.g. "New Episode: Series S01E05"; written by
+# episode_code() and parsed for batching here and for de-duplication in reconciliation
+EPISODE_CODE_RE = re.compile(r'S(\d+)E(\d+)')
+
+# Subjects covering several episodes only give a count, e.g. "New Episodes: Series (12 episodes)";
+# their episode codes are read from the body, which lists every episode
+GROUPED_EPISODES_SUBJECT_SUFFIX = " episodes)"
+
+
+def episode_code(season_num: int, episode_num: int) -> str:
+    """Format an episode the way notification subjects write it, e.g. S01E05"""
+    return f"S{season_num:02d}E{episode_num:02d}"
+
+
+def notification_episodes(subject: str, body: str = None) -> List[tuple]:
+    """(season, episode) pairs an episode notification covers, from its subject or, when the
+    subject only gives a count, from its body"""
+    source = body if (subject or "").endswith(GROUPED_EPISODES_SUBJECT_SUFFIX) else subject
+    return [(int(s), int(e)) for s, e in EPISODE_CODE_RE.findall(source or "")]
+
+
+@lru_cache(maxsize=None)
+def _template(source: str) -> Template:
+    """Compile a template once; each render method passes the same source on every call"""
+    return Template(source)
+
 
 class EmailService:
     def __init__(self):
@@ -62,7 +95,7 @@ class EmailService:
     
     def render_episode_notification(self, series_title: str, episodes: List[dict], poster_url: str = None) -> str:
         """Render HTML email for new episode(s) notification"""
-        template = Template("""
+        template = _template("""
         <!DOCTYPE html>
         <html>
         <head>
@@ -114,7 +147,7 @@ class EmailService:
     
     def render_movie_notification(self, movie_title: str, year: int = None, poster_url: str = None) -> str:
         """Render HTML email for new movie notification"""
-        template = Template("""
+        template = _template("""
         <!DOCTYPE html>
         <html>
         <head>
@@ -272,13 +305,9 @@ class EmailService:
                 episodes = []
                 series_title = None
                 for b in batch:
-                    # Extract episode info from subject (e.g., "New Episode: Series S01E05")
-                    import re
-                    match = re.search(r'S(\d+)E(\d+)', b.subject)
-                    if match:
-                        season_num = int(match.group(1))
-                        episode_num = int(match.group(2))
-                        
+                    # Extract episode info from subject (e.g., "New Episode: Series S01E05"),
+                    # or the body for grouped ones ("New Episodes: Series (3 episodes)")
+                    for season_num, episode_num in notification_episodes(b.subject, b.body):
                         # Try to get episode title from tracking table
                         tracking = db.query(EpisodeTracking).filter(
                             EpisodeTracking.series_id == b.series_id,
@@ -293,7 +322,10 @@ class EmailService:
                         })
                     # Extract series title from first notification
                     if not series_title:
-                        series_title = b.subject.split(':')[1].split('S')[0].strip() if ':' in b.subject else "Series"
+                        if b.subject.endswith(GROUPED_EPISODES_SUBJECT_SUFFIX) and ':' in b.subject:
+                            series_title = b.subject.split(':', 1)[1].rsplit(' (', 1)[0].strip()
+                        else:
+                            series_title = b.subject.split(':')[1].split('S')[0].strip() if ':' in b.subject else "Series"
                 
                 # Sort episodes by season, then episode number
                 episodes.sort(key=lambda x: (x['season'], x['episode']))
@@ -348,37 +380,51 @@ class EmailService:
             
             db.commit()
         
-        # Process movie notifications (no batching needed)
-        for notif in movie_notifications:
-            success = await self.send_email(
-                to_email=notif.user.email,
-                subject=notif.subject,
-                html_body=notif.body
-            )
-            
-            if success:
-                notif.sent = True
-                notif.sent_at = datetime.utcnow()
-            else:
-                notif.error_message = "SMTP send failed"
-            
-            db.commit()
+        # Process movie notifications (no batching needed) and other notifications
+        # (quality_waiting, coming_soon, weekly_summary), marking results in one statement each
+        sent_ids = []
+        failed_ids = []
         
-        # Process other notifications (quality_waiting, coming_soon, weekly_summary)
-        for notif in other_notifications:
-            success = await self.send_email(
-                to_email=notif.user.email,
-                subject=notif.subject,
-                html_body=notif.body
-            )
-            
-            if success:
-                notif.sent = True
-                notif.sent_at = datetime.utcnow()
-            else:
-                notif.error_message = "SMTP send failed"
-            
-            db.commit()
+        def mark_results():
+            """Record the sends so far; called every SEND_RESULTS_FLUSH_EVERY sends and when the loop ends"""
+            if sent_ids:
+                db.execute(
+                    update(Notification)
+                    .where(Notification.id.in_(sent_ids))
+                    .values(sent=True, sent_at=datetime.utcnow())
+                )
+            if failed_ids:
+                db.execute(
+                    update(Notification)
+                    .where(Notification.id.in_(failed_ids))
+                    .values(error_message="SMTP send failed")
+                )
+            if sent_ids or failed_ids:
+                db.commit()
+            sent_ids.clear()
+            failed_ids.clear()
+        
+        try:
+            for notif in movie_notifications + other_notifications:
+                success = await self.send_email(
+                    to_email=notif.user.email,
+                    subject=notif.subject,
+                    html_body=notif.body
+                )
+                
+                if success:
+                    sent_ids.append(notif.id)
+                else:
+                    failed_ids.append(notif.id)
+                
+                if len(sent_ids) + len(failed_ids) >= SEND_RESULTS_FLUSH_EVERY:
+                    mark_results()
+        except Exception:
+            db.rollback()  # Clear a failed transaction so the sends below can still be recorded
+            raise
+        finally:
+            # Delivered emails must be marked even if the loop stopped early, or the next run resends them
+            mark_results()
         
         logger.info(f"Processed {len(processed_tv)} TV notifications, {len(movie_notifications)} movie notifications, {len(other_notifications)} other notifications")
     
@@ -388,7 +434,7 @@ class EmailService:
         media_icon = "📺" if media_type == "tv" else "🎬"
         media_label = "TV Show" if media_type == "tv" else "Movie"
         
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -467,7 +513,7 @@ class EmailService:
         media_icon = "📺" if media_type == "tv" else "🎬"
         media_label = "TV Show" if media_type == "tv" else "Movie"
         
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -550,7 +596,7 @@ class EmailService:
         media_label = "TV Show" if media_type == "tv" else "Movie"
         issue_label = issue_type.capitalize() if issue_type else "Reported"
         
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -640,7 +686,7 @@ class EmailService:
             "auto_notify": "🤖 Auto-fix mode — blacklist & re-search has been triggered automatically."
         }.get(autofix_mode, "Unknown mode")
         
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -718,7 +764,7 @@ class EmailService:
 
     def render_maintenance_announcement(self, title: str, description: str, start_time: str, end_time: str, duration: str) -> str:
         """Render maintenance window announcement email"""
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -787,7 +833,7 @@ class EmailService:
 
     def render_maintenance_reminder(self, title: str, description: str, start_time: str, end_time: str, duration: str, minutes_until: int) -> str:
         """Render maintenance window reminder email (sent ~1 hour before)"""
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -848,7 +894,7 @@ class EmailService:
 
     def render_maintenance_complete(self, title: str, description: str = None) -> str:
         """Render maintenance complete / we're back email"""
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -904,7 +950,7 @@ class EmailService:
 
     def render_maintenance_cancelled(self, title: str) -> str:
         """Render maintenance cancelled email"""
-        template = Template("""
+        template = _template("""
 <!DOCTYPE html>
 <html>
 <head>
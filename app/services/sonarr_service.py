@@ -1,11 +1,47 @@
+import asyncio
 import httpx
 import logging
-from typing import Optional, Dict
+import time
+from collections import defaultdict
+from typing import Optional, Dict, List
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client so Sonarr connections are kept alive and reused across
+# calls, instances and monitor runs instead of reconnecting for every request
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared Sonarr HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60)
+        )
+    return _client
+
+
+# GET retries on rate limiting / transient upstream errors, with exponential back-off
+GET_MAX_ATTEMPTS = 4
+GET_MAX_BACKOFF_SECONDS = 30
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Short-lived cache for GET responses requested with cache_ttl
+# (base_url, endpoint) -> (expires_at monotonic seconds, data)
+_response_cache = {}
+_response_cache_locks = defaultdict(asyncio.Lock)
+
+
+def _prune_response_cache(now: float):
+    """Drop expired responses, and the locks of keys that aren't cached or being fetched"""
+    for key in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[key]
+    for key in [k for k, lock in _response_cache_locks.items() if k not in _response_cache and not lock.locked()]:
+        del _response_cache_locks[key]
+
 
 class SonarrService:
     def __init__(self, base_url: str = None, api_key: str = None, instance_name: str = "Sonarr"):
@@ -22,21 +58,58 @@ class SonarrService:
             "Content-Type": "application/json"
         }
     
-    async def _get(self, endpoint: str) -> dict:
-        """Make GET request to Sonarr API"""
+    async def _get(self, endpoint: str, cache_ttl: int = 0) -> dict:
+        """Make GET request to Sonarr API.
+        
+        With cache_ttl > 0, responses are shared for that many seconds between
+        callers requesting the same endpoint (concurrent callers wait for one fetch).
+        """
+        if cache_ttl <= 0:
+            return await self._fetch(endpoint)
+        
+        key = (self.base_url, endpoint)
+        async with _response_cache_locks[key]:
+            cached = _response_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            data = await self._fetch(endpoint)
+            now = time.monotonic()
+            _response_cache[key] = (now + cache_ttl, data)
+            _prune_response_cache(now)
+            return data
+    
+    async def _fetch(self, endpoint: str) -> dict:
+        """Make uncached GET request to Sonarr API, retrying rate-limited and transient failures"""
         url = f"{self.base_url}/api/v3{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=self.headers)
+        for attempt in range(1, GET_MAX_ATTEMPTS + 1):
+            try:
+                response = await _get_client().get(url, headers=self.headers)
+            except httpx.TransportError as e:
+                if attempt == GET_MAX_ATTEMPTS:
+                    raise
+                delay = min(2 ** attempt, GET_MAX_BACKOFF_SECONDS)
+                logger.warning(f"{self.instance_name} request {endpoint} failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < GET_MAX_ATTEMPTS:
+                # Honour Retry-After (seconds) when the server sends it
+                retry_after = response.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+                delay = min(delay, GET_MAX_BACKOFF_SECONDS)
+                logger.warning(f"{self.instance_name} returned {response.status_code} for {endpoint}, retrying in {delay}s")
+                await asyncio.sleep(delay)
+                continue
+            
             response.raise_for_status()
             return response.json()
     
     async def _post(self, endpoint: str, data: dict) -> dict:
         """Make POST request to Sonarr API"""
         url = f"{self.base_url}/api/v3{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, headers=self.headers, json=data)
-            response.raise_for_status()
-            return response.json()
+        response = await _get_client().post(url, headers=self.headers, json=data)
+        response.raise_for_status()
+        return response.json()
     
     async def get_series(self, series_id: int) -> Optional[Dict]:
         """Get series details from Sonarr"""
@@ -116,6 +189,22 @@ class SonarrService:
             logger.error(f"Failed to fetch episodes for series {series_id}: {e}")
             return None
     
+    async def get_episodes_for_series_ids(self, series_ids: List[int], concurrency: int = 10) -> Dict[int, list]:
+        """Get episodes for many series at once, keyed by series ID.
+        
+        Sonarr's /episode endpoint only accepts a single seriesId, so the
+        per-series requests are issued concurrently (at most `concurrency`
+        in flight). Series whose fetch fails are omitted from the result.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def fetch(series_id: int):
+            async with semaphore:
+                return series_id, await self.get_episodes_by_series(series_id)
+        
+        results = await asyncio.gather(*(fetch(series_id) for series_id in set(series_ids)))
+        return {series_id: episodes for series_id, episodes in results if episodes is not None}
+    
     async def get_calendar(self, start_date: str = None, end_date: str = None) -> Optional[list]:
         """Get calendar of upcoming episodes"""
         try:
@@ -154,10 +243,9 @@ class SonarrService:
     async def _delete(self, endpoint: str, params: dict = None) -> bool:
         """Make DELETE request to Sonarr API"""
         url = f"{self.base_url}/api/v3{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return True
+        response = await _get_client().delete(url, headers=self.headers, params=params)
+        response.raise_for_status()
+        return True
     
     async def blacklist_and_research_series(self, tmdb_id: int) -> dict:
         """Blacklist current episode files for a series and trigger a new search.